@@ -1,12 +1,93 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from app.utils.db import Base, init_db
-from app.api import user_router, auth_router, family_router
+from app.utils.db import Base, init_db, async_engine, AsyncSessionLocal
+from app.api import user_router, auth_router, family_router, jwks_router
 from app.config.config import config_by_name
 from app.utils.logger import setup_logging
+from app.utils.pool_metrics import pool_status
+from app.utils.password_hasher import password_hasher
+from app.utils.security import token_cache
+from app.helper.user_helper import user_principal_cache
+from app.helper import invitation_helper, notification_helper, token_helper
+from app.utils.notification_client import notification_client
+from app.utils.scheduler import PeriodicTask
+from app.utils.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, registry as metrics_registry
+from app.utils.http_metrics import MetricsMiddleware
+from app.utils.query_metrics import QueryStatsMiddleware
+from app.utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN
+from app.utils.schema_check import verify_schema
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    password_hasher.start()
+    notification_client.start()
+    for task in app.state.periodic_tasks:
+        if task.run_on_startup:
+            await task.run_once()
+        task.start()
+    yield
+    # 종료 시 주기 작업, 해시 워커, 알림 클라이언트와 비동기 커넥션 풀 정리
+    for task in app.state.periodic_tasks:
+        await task.stop()
+    password_hasher.shutdown()
+    await notification_client.aclose()
+    await async_engine.dispose()
+
+def with_session(job):
+    """DB 세션을 받는 헬퍼 함수를 주기 작업용 함수로 감싸기"""
+    async def run():
+        async with AsyncSessionLocal() as db:
+            return await job(db)
+    return run
+
+def health_metrics(app: FastAPI):
+    """/health/* 엔드포인트의 지표를 /metrics 형식으로 변환하는 collector"""
+    from app.utils.db import engine
+
+    def collect():
+        pools = {"sync": pool_status(engine), "async": pool_status(async_engine.sync_engine)}
+        caches = {"token": token_cache.stats(), "user_principal": user_principal_cache.stats()}
+        jobs = {task.name: task.status() for task in app.state.periodic_tasks}
+        breaker = notification_client.breaker.stats()
+
+        def by_pool(key):
+            return [({"engine": name}, status.get(key)) for name, status in pools.items()]
+
+        def by_cache(key):
+            return [({"cache": name}, stats[key]) for name, stats in caches.items()]
+
+        def by_task(key):
+            return [({"task": name}, status[key]) for name, status in jobs.items()]
+
+        breaker_labels = {"name": notification_client.breaker.name}
+        return [
+            ("db_pool_checked_out", "gauge", "사용 중인 커넥션 수", by_pool("checked_out")),
+            ("db_pool_checkouts_total", "counter", "커넥션 checkout 횟수", by_pool("checkouts")),
+            ("db_pool_checkout_timeouts_total", "counter", "커넥션 checkout 타임아웃 횟수", by_pool("timeouts")),
+            ("db_pool_checkout_wait_seconds_total", "counter", "커넥션 checkout 대기 시간 합계 (초)",
+             by_pool("wait_seconds_total")),
+            ("cache_hits_total", "counter", "캐시 적중 수", by_cache("hits")),
+            ("cache_misses_total", "counter", "캐시 미적중 수", by_cache("misses")),
+            ("cache_size", "gauge", "캐시 항목 수", by_cache("size")),
+            ("periodic_task_runs_total", "counter", "주기 작업 실행 횟수", by_task("runs")),
+            ("periodic_task_failures_total", "counter", "주기 작업 실패 횟수", by_task("failures")),
+            ("periodic_task_last_duration_seconds", "gauge", "주기 작업 마지막 실행 시간 (초)",
+             by_task("last_duration_seconds")),
+            ("circuit_breaker_state", "gauge", "서킷 브레이커 현재 상태 (해당 상태만 1)",
+             [({**breaker_labels, "state": state}, int(breaker["state"] == state))
+              for state in (CLOSED, OPEN, HALF_OPEN)]),
+            ("circuit_breaker_transitions_total", "counter", "서킷 브레이커 상태 전이 횟수",
+             [({**breaker_labels, "transition": transition}, count)
+              for transition, count in breaker["transitions"].items()]),
+            ("circuit_breaker_short_circuited_total", "counter", "회로가 열려 즉시 실패한 호출 수",
+             [(breaker_labels, breaker["short_circuited"])]),
+        ]
+
+    return collect
 
 def create_app(config_name: str):
-    app = FastAPI()
+    app = FastAPI(lifespan=lifespan)
 
     # CORS 설정 추가
     app.add_middleware(
@@ -17,6 +98,9 @@ def create_app(config_name: str):
         allow_headers=["*"],
         expose_headers=["*"],
     )
+    # 요청별 SQL 집계 (Server-Timing 헤더), 요청 수/처리 시간 지표 (가장 바깥에서 CORS preflight까지 포함해 측정)
+    app.add_middleware(QueryStatsMiddleware)
+    app.add_middleware(MetricsMiddleware)
 
     # 설정 로드 - () 추가하여 인스턴스화
     config = config_by_name[config_name]()
@@ -31,16 +115,68 @@ def create_app(config_name: str):
     # engine을 다시 가져와서 사용
     from app.utils.db import engine
     Base.metadata.create_all(bind=engine)
+    # 기존 데이터베이스에 마이그레이션(인덱스/제약조건/컬럼)이 적용되었는지 확인 (누락 시 시작 실패)
+    verify_schema(engine)
+
+    # 백그라운드 주기 작업 (lifespan에서 시작/종료)
+    app.state.periodic_tasks = [
+        PeriodicTask("revocation-sync", config.REVOCATION_SYNC_SECONDS,
+                     with_session(token_helper.sync_revocation_list), run_on_startup=True),
+        PeriodicTask("revocation-purge", config.REVOCATION_PURGE_SECONDS,
+                     with_session(token_helper.purge_expired_revoked_tokens)),
+        PeriodicTask("refresh-token-purge", config.REFRESH_TOKEN_PURGE_SECONDS,
+                     with_session(token_helper.purge_expired_refresh_tokens)),
+        PeriodicTask("invitation-sweep", config.INVITATION_SWEEP_SECONDS,
+                     with_session(invitation_helper.sweep_expired_invitations_async)),
+        PeriodicTask("notification-dispatch", config.NOTIFICATION_DISPATCH_SECONDS,
+                     with_session(notification_helper.dispatch_pending_notifications)),
+        PeriodicTask("notification-purge", config.NOTIFICATION_PURGE_SECONDS,
+                     with_session(notification_helper.purge_sent_notifications)),
+    ]
 
     # 라우터 등록
     app.include_router(user_router)
     app.include_router(auth_router)
     app.include_router(family_router)
+    app.include_router(jwks_router)
 
     @app.get("/health")
     def health_check():
         return {"status": 200, "message": "OK", "service": "user-service", "port": 8000}
 
+    @app.get("/health/db-pool")
+    def db_pool_status():
+        """커넥션 풀 상태 및 checkout 대기 지표 (레플리카별 풀 크기 산정용)"""
+        return {
+            "sync": pool_status(engine),
+            "async": pool_status(async_engine.sync_engine),
+        }
+
+    @app.get("/health/caches")
+    def cache_status():
+        """인증 캐시 적중률 (토큰 검증, 사용자 principal)"""
+        return {
+            "token": token_cache.stats(),
+            "user_principal": user_principal_cache.stats(),
+        }
+
+    @app.get("/health/circuit-breakers")
+    def circuit_breaker_status():
+        """외부 서비스 서킷 브레이커 상태와 상태 전이 횟수 (open 상태면 알림 발송이 지연되는 중)"""
+        return {notification_client.breaker.name: notification_client.breaker.stats()}
+
+    @app.get("/health/jobs")
+    def jobs_status():
+        """백그라운드 주기 작업의 실행 횟수와 마지막 실행 결과"""
+        return {task.name: task.status() for task in app.state.periodic_tasks}
+
+    collect_health_metrics = health_metrics(app)
+
+    @app.get("/metrics", include_in_schema=False)
+    def metrics():
+        """Prometheus 텍스트 포맷 지표 (라우트별 요청 수/처리 시간 + /health/* 지표)"""
+        return Response(metrics_registry.render((collect_health_metrics,)), media_type=METRICS_CONTENT_TYPE)
+
     @app.get("/")
     def root():
         return {"message": "Hello World"}
@@ -2,9 +2,11 @@ from fastapi import APIRouter
 from app.api.user_router import router as user_router
 from app.api.auth_router import router as auth_router
 from app.api.family_router import router as family_router
+from app.api.jwks_router import router as jwks_router
 
 router = APIRouter()
 
 router.include_router(user_router)
 router.include_router(auth_router)
-router.include_router(family_router)
\ No newline at end of file
+router.include_router(family_router)
+router.include_router(jwks_router)
\ No newline at end of file
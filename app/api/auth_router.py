@@ -1,24 +1,34 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Request
-from sqlalchemy.orm import Session
-from app.schemas.user_schema import UserCreate, UserLogin, Token, User as UserSchema, RegisterResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas.user_schema import (
+    UserCreate, UserLogin, Token, User as UserSchema, RegisterResponse, UserPrincipal,
+    TokenBatchVerifyRequest, TokenBatchVerifyResponse, TokenVerifyResult, RefreshTokenRequest
+)
+from app.config.config import get_config
 from app.models import user as user_model
-from app.utils.db import get_db
+from app.utils.db import get_async_db
 from app.utils import security
-from app.helper import user_helper
+from app.utils.password_hasher import password_hasher
+from app.helper import user_helper, token_helper
+from app.api.dependencies import get_current_user
 from datetime import timedelta
+from typing import Optional
 import logging
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+TOKEN_BATCH_MAX = get_config().TOKEN_BATCH_MAX
+ACCESS_TOKEN_EXPIRES_IN = security.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
 router = APIRouter(prefix = "/auth", tags = ["Auth"])
 
 @router.post("/register", response_model = RegisterResponse)
-def register(user : UserCreate, db : Session = Depends(get_db)) :
+async def register(user : UserCreate, db : AsyncSession = Depends(get_async_db)) :
     logger.info(f"회원가입 시도: {user.email}")
     
     # 이메일 중복 검사
-    existing_user = user_helper.get_user_by_email(db, user.email)
+    existing_user = await user_helper.get_user_by_email_async(db, user.email)
     if existing_user:
         logger.warning(f"회원가입 실패: 이메일 중복 - {user.email}")
         raise HTTPException(
@@ -27,7 +37,7 @@ def register(user : UserCreate, db : Session = Depends(get_db)) :
         )
     
     # 사용자명 중복 검사
-    existing_username = user_helper.get_user_by_username(db, user.username)
+    existing_username = await user_helper.get_user_by_username_async(db, user.username)
     if existing_username:
         logger.warning(f"회원가입 실패: 사용자명 중복 - {user.username}")
         raise HTTPException(
@@ -35,8 +45,8 @@ def register(user : UserCreate, db : Session = Depends(get_db)) :
             detail="이미 사용 중인 사용자명입니다."
         )
     
-    # 비밀번호 해시 적용
-    hashed_password = security.hash_password(user.password)
+    # 비밀번호 해시 적용 (bcrypt는 CPU 작업이므로 전용 프로세스 풀에서 실행)
+    hashed_password = await password_hasher.hash_password(user.password)
     
     # 사용자 생성 (해시된 비밀번호 사용)
     user_data = UserCreate(
@@ -47,31 +57,43 @@ def register(user : UserCreate, db : Session = Depends(get_db)) :
         password=hashed_password  # 해시된 비밀번호 전달
     )
     
-    db_user = user_helper.create_user(db=db, user=user_data)
+    db_user = await user_helper.create_user_async(db=db, user=user_data)
     
     logger.info(f"회원가입 성공: {user.email}, ID: {db_user.id}")
     
     # 회원가입 후 자동 로그인 (토큰 반환)
     access_token = security.create_access_token({"sub": str(db_user.id)})
+    refresh_token = await token_helper.issue_refresh_token(db, db_user.id)
     
     return RegisterResponse(
         message="회원가입이 완료되었습니다.",
         access_token=access_token,
         token_type="bearer",
         user_role=db_user.role.value,
-        username=db_user.username
+        username=db_user.username,
+        refresh_token=refresh_token,
+        expires_in=ACCESS_TOKEN_EXPIRES_IN
     )
 
 @router.post("/login", response_model = Token)
-def login(login_data : UserLogin, db : Session = Depends(get_db)) :
+async def login(login_data : UserLogin, db : AsyncSession = Depends(get_async_db)) :
     logger.info(f"로그인 시도: {login_data.email}")
     
-    user = user_helper.get_user_by_email(db = db, email = login_data.email)
-    if not user or not security.verify_password(login_data.password, user.hashed_password) :
+    user = await user_helper.get_user_by_email_async(db = db, email = login_data.email)
+    verified, new_hash = (False, None)
+    if user :
+        verified, new_hash = await password_hasher.verify_and_update_password(login_data.password, user.hashed_password)
+    if not verified :
         logger.warning(f"로그인 실패: {login_data.email} - 잘못된 이메일 또는 비밀번호")
         raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "이메일 또는 비밀번호가 올바르지 않습니다.")
+
+    # 저장된 해시의 알고리즘/비용이 현재 설정과 다르면 새 해시로 교체 (비밀번호 재설정 불필요)
+    if new_hash :
+        await user_helper.update_password_hash_async(db, user.id, new_hash)
+        logger.info(f"비밀번호 해시 갱신: 사용자 ID {user.id}")
     
     access_token = security.create_access_token({"sub" : str(user.id)})
+    refresh_token = await token_helper.issue_refresh_token(db, user.id)
     
     logger.info(f"로그인 성공: {login_data.email}, ID: {user.id}")
     
@@ -80,12 +102,44 @@ def login(login_data : UserLogin, db : Session = Depends(get_db)) :
             "access_token" : access_token, 
             "token_type" : "bearer",
             "user_role": getattr(user, 'role', 'user'),  # 사용자 역할 추가
-            "username": user.username
+            "username": user.username,
+            "refresh_token": refresh_token,
+            "expires_in": ACCESS_TOKEN_EXPIRES_IN
+        }
+
+@router.post("/refresh", response_model = Token)
+async def refresh(refresh_data : RefreshTokenRequest, db : AsyncSession = Depends(get_async_db)) :
+    """리프레시 토큰으로 액세스 토큰 재발급 (리프레시 토큰도 함께 회전)"""
+    try :
+        user_id, refresh_token = await token_helper.rotate_refresh_token(db, refresh_data.refresh_token)
+    except ValueError as e :
+        logger.warning(f"토큰 재발급 실패: {str(e)}")
+        raise HTTPException(
+            status_code = status.HTTP_401_UNAUTHORIZED,
+            detail = str(e),
+            headers = {"WWW-Authenticate": "Bearer error=\"invalid_token\""}
+        )
+
+    principal = await user_helper.get_user_principal_async(db, user_id)
+    if principal is None :
+        raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "사용자를 찾을 수 없습니다.")
+
+    return {
+            "access_token" : security.create_access_token({"sub" : str(user_id)}),
+            "token_type" : "bearer",
+            "user_role": principal.role.value,
+            "username": principal.username,
+            "refresh_token": refresh_token,
+            "expires_in": ACCESS_TOKEN_EXPIRES_IN
         }
 
 @router.post("/logout")
-async def logout(request: Request, db: Session = Depends(get_db)):
-    """로그아웃 처리 - 토큰 검증 및 로그 기록"""
+async def logout(
+    request: Request,
+    logout_data: Optional[RefreshTokenRequest] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """로그아웃 처리 - 토큰 검증, 리프레시 토큰 폐기 및 로그 기록"""
     try:
         # Authorization 헤더에서 토큰 추출
         auth_header = request.headers.get("Authorization")
@@ -111,20 +165,23 @@ async def logout(request: Request, db: Session = Depends(get_db)):
             payload = security.decode_access_token(token)
             if payload and payload.get("sub"):
                 user_id = int(payload.get("sub"))
-                user = user_helper.get_user_by_id(db, user_id)
+                user = await user_helper.get_user_principal_async(db, user_id)
                 if user:
                     logger.info(f"로그아웃 성공: 사용자 ID {user_id} ({user.email})")
                 else:
                     logger.warning(f"로그아웃: 사용자 ID {user_id}를 찾을 수 없음")
+                # 액세스 토큰 폐기 (만료 전까지 모든 레플리카에서 거절)
+                await token_helper.revoke_access_token(db, payload)
             else:
                 logger.warning("로그아웃: 토큰에서 사용자 ID 추출 불가")
         except Exception as e:
             logger.warning(f"로그아웃: 토큰 검증 실패 - {str(e)}")
             # 토큰 검증 실패해도 로그아웃은 허용
         
-        # TODO: 실제 운영환경에서는 토큰을 블랙리스트에 추가
-        # 현재는 로그만 기록
-        
+        # 리프레시 토큰이 전달되면 해당 로그인 세션의 토큰 묶음 폐기
+        if logout_data and await token_helper.revoke_refresh_token(db, logout_data.refresh_token):
+            logger.info("로그아웃: 리프레시 토큰 폐기")
+
         return {
             "message": "로그아웃되었습니다.",
             "success": True
@@ -140,80 +197,62 @@ async def logout(request: Request, db: Session = Depends(get_db)):
         )
 
 @router.get("/verify")
-async def verify_token(
-    request: Request,
-    db: Session = Depends(get_db)
+async def verify_token(current_user: UserPrincipal = Depends(get_current_user)):
+    """토큰 검증 및 사용자 정보 반환 (principal 캐시 적중 시 DB 조회 없음)"""
+    logger.info(f"토큰 검증 성공: 사용자 ID {current_user.id}")
+    return {
+        "user_id": current_user.id,
+        "email": current_user.email,
+        "role": current_user.role,
+        "is_active": True,
+        "username": current_user.username
+    }
+
+@router.post("/verify/batch", response_model=TokenBatchVerifyResponse)
+async def verify_tokens_batch(
+    batch: TokenBatchVerifyRequest,
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """토큰 검증 및 사용자 정보 반환"""
-    auth_header = request.headers.get("Authorization")
-    if not auth_header:
-        logger.warning("토큰 검증 실패: Authorization 헤더 없음")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="인증 토큰이 필요합니다.",
-            headers={"WWW-Authenticate": "Bearer"}
-        )
-    
-    parts = auth_header.split()
-    if len(parts) != 2 or parts[0].lower() != "bearer":
-        logger.warning("토큰 검증 실패: 잘못된 Authorization 헤더 형식")
+    """여러 토큰을 한 번에 검증 (게이트웨이용, 사용자 조회는 한 번의 쿼리로 처리)"""
+    if len(batch.tokens) > TOKEN_BATCH_MAX:
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Authorization 헤더 형식이 올바르지 않습니다.",
-            headers={"WWW-Authenticate": "Bearer"}
-        )
-    
-    token = parts[1]
-    
-    try:
-        # JWT 토큰 디코딩
-        payload = security.decode_access_token(token)
-        if not payload:
-            logger.warning("토큰 검증 실패: 유효하지 않은 토큰")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="유효하지 않은 토큰입니다.",
-                headers={"WWW-Authenticate": "Bearer error=\"invalid_token\""}
-            )
-        
-        user_id = int(payload.get("sub"))
-        if not user_id:
-            logger.warning("토큰 검증 실패: 토큰에서 사용자 ID 추출 불가")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="토큰에서 사용자 ID를 추출할 수 없습니다.",
-                headers={"WWW-Authenticate": "Bearer error=\"invalid_token\""}
-            )
-        
-        # 사용자 존재 여부 확인
-        user = user_helper.get_user_by_id(db, user_id)
-        if not user:
-            logger.warning(f"토큰 검증 실패: 사용자 ID {user_id}를 찾을 수 없음")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="사용자를 찾을 수 없습니다."
-            )
-        
-        logger.info(f"토큰 검증 성공: 사용자 ID {user_id}")
-        return {
-            "user_id": user.id,
-            "email": user.email,
-            "role": getattr(user, 'role', 'user'),
-            "is_active": getattr(user, 'is_active', True),
-            "username": user.username
-        }
-        
-    except ValueError:
-        logger.warning("토큰 검증 실패: 토큰 형식 오류")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="토큰 형식이 올바르지 않습니다.",
-            headers={"WWW-Authenticate": "Bearer error=\"invalid_token\""}
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 최대 {TOKEN_BATCH_MAX}개의 토큰만 검증할 수 있습니다."
         )
-    except Exception as e:
-        logger.error(f"토큰 검증 중 예상치 못한 오류: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="토큰 검증에 실패했습니다.",
-            headers={"WWW-Authenticate": "Bearer error=\"invalid_token\""}
-        )
\ No newline at end of file
+
+    # 1. 토큰별 서명/만료 검증 (캐시 적중 시 dict 조회) -> (user_id, 실패 사유)
+    decoded = []
+    for token in batch.tokens:
+        try:
+            payload = security.decode_access_token(token)
+            decoded.append((int(payload.get("sub")), None))
+        except HTTPException as e:
+            decoded.append((None, e.detail))
+        except (TypeError, ValueError):
+            decoded.append((None, "토큰에서 사용자 ID를 추출할 수 없습니다."))
+
+    # 2. 참조된 사용자 일괄 조회
+    principals = await user_helper.get_user_principals_async(
+        db, [user_id for user_id, error in decoded if error is None]
+    )
+
+    results = []
+    for user_id, error in decoded:
+        if error is not None:
+            results.append(TokenVerifyResult(valid=False, error=error))
+            continue
+        principal = principals.get(user_id)
+        if principal is None:
+            results.append(TokenVerifyResult(valid=False, user_id=user_id, error="사용자를 찾을 수 없습니다."))
+            continue
+        results.append(TokenVerifyResult(
+            valid=True,
+            user_id=principal.id,
+            email=principal.email,
+            role=principal.role,
+            is_active=True,
+            username=principal.username
+        ))
+
+    logger.info(f"일괄 토큰 검증: {len(batch.tokens)}건, 유효 {sum(r.valid for r in results)}건")
+    return TokenBatchVerifyResponse(results=results)
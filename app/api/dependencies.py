@@ -0,0 +1,61 @@
+from fastapi import Depends, HTTPException, status, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas.user_schema import UserPrincipal
+from app.utils.db import get_async_db
+from app.utils import security
+from app.helper import user_helper
+import logging
+
+logger = logging.getLogger(__name__)
+
+def get_bearer_token(request: Request) -> str:
+    """Authorization 헤더에서 Bearer 토큰 추출"""
+    auth_header = request.headers.get("Authorization")
+    if not auth_header:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="인증 토큰이 필요합니다.",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+
+    parts = auth_header.split()
+    if len(parts) != 2 or parts[0].lower() != "bearer":
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authorization 헤더 형식이 올바르지 않습니다.",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+
+    return parts[1]
+
+async def get_principal_for_token(db: AsyncSession, token: str) -> UserPrincipal:
+    """토큰을 검증하고 해당 사용자의 principal 반환 (캐시 적중 시 DB 조회 없음)"""
+    payload = security.decode_access_token(token)
+
+    try:
+        user_id = int(payload.get("sub"))
+    except (TypeError, ValueError):
+        logger.warning("토큰 검증 실패: 토큰에서 사용자 ID 추출 불가")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="토큰에서 사용자 ID를 추출할 수 없습니다.",
+            headers={"WWW-Authenticate": "Bearer error=\"invalid_token\""}
+        )
+
+    principal = await user_helper.get_user_principal_async(db, user_id)
+    if principal is None:
+        logger.warning(f"토큰 검증 실패: 사용자 ID {user_id}를 찾을 수 없음")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="사용자를 찾을 수 없습니다."
+        )
+
+    return principal
+
+async def get_current_user(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
+) -> UserPrincipal:
+    """현재 로그인한 사용자의 principal (모든 라우터 공용 인증 의존성)"""
+    token = get_bearer_token(request)
+    return await get_principal_for_token(db, token)
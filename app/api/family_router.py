@@ -1,7 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Request
-from sqlalchemy.orm import Session
-from typing import List
-import httpx
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 from app.schemas.invitation_schema import (
     InvitationCodeCreate, 
     InvitationCodeResponse, 
@@ -16,131 +16,44 @@ from app.schemas.invitation_schema import (
 )
 from app.models import user as user_model
 from app.models.invitation import Invitation
-from app.utils.db import get_db
-from app.utils import security
+from app.models.relationship_type import RelationshipType
+from app.schemas.user_schema import UserPrincipal
+from app.utils.db import get_async_db
+from app.utils.pagination import MAX_PAGE_SIZE
 from app.helper import invitation_helper
+from app.api.dependencies import get_current_user
 from datetime import datetime
 
 router = APIRouter(prefix="/family", tags=["Family"])
 
-# Notification service URL
-NOTIFICATION_SERVICE_URL = "http://localhost:8002"
-
-async def send_notification_to_service(endpoint: str, data: dict):
-    """Notification service에 알림 요청을 보냅니다."""
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{NOTIFICATION_SERVICE_URL}{endpoint}",
-                json=data,
-                timeout=10.0
-            )
-            if response.status_code == 200:
-                print(f"알림 발송 성공: {endpoint}")
-                return True
-            else:
-                print(f"알림 발송 실패: {endpoint}, 상태: {response.status_code}")
-                return False
-    except Exception as e:
-        print(f"알림 서비스 호출 오류: {endpoint}, 오류: {str(e)}")
-        return False
-
-def get_current_user_id(request: Request, db: Session = Depends(get_db)) -> int:
-    """현재 로그인한 사용자의 ID를 반환 (JWT 토큰에서 추출)"""
-    auth_header = request.headers.get('Authorization')
-    if not auth_header:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="인증 토큰이 필요합니다.",
-            headers={"WWW-Authenticate": "Bearer"}
-        )
-    
-    parts = auth_header.split()
-    if len(parts) != 2 or parts[0].lower() != "bearer":
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Authorization 헤더 형식이 올바르지 않습니다.",
-            headers={"WWW-Authenticate": "Bearer"}
-        )
-    
-    token = parts[1]
-    
-    try:
-        # JWT 토큰 디코딩
-        payload = security.decode_access_token(token)
-        if not payload:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="유효하지 않은 토큰입니다.",
-                headers={"WWW-Authenticate": "Bearer error=\"invalid_token\""}
-            )
-        
-        user_id = int(payload.get("sub"))
-        if not user_id:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="토큰에서 사용자 ID를 추출할 수 없습니다.",
-                headers={"WWW-Authenticate": "Bearer error=\"invalid_token\""}
-            )
-        
-        # 사용자 존재 여부 확인
-        user = db.query(user_model.User).filter(user_model.User.id == user_id).first()
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="사용자를 찾을 수 없습니다."
-            )
-        
-        return user_id
-        
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="토큰 형식이 올바르지 않습니다.",
-            headers={"WWW-Authenticate": "Bearer error=\"invalid_token\""}
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="토큰 검증에 실패했습니다.",
-            headers={"WWW-Authenticate": "Bearer error=\"invalid_token\""}
-        )
-
 @router.post("/invite-code", response_model=InvitationCodeResponse)
 async def create_invitation_code(
     connection_data: InvitationCodeCreate,
-    current_user_id: int = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """초대코드 생성 (시니어만 가능)"""
     try:
-        # 시니어 권한 확인
-        user = db.query(user_model.User).filter(user_model.User.id == current_user_id).first()
-        if not user or user.role != user_model.UserRole.senior:
+        # 시니어 권한 확인 (인증 의존성의 principal 사용, 추가 조회 없음)
+        if current_user.role != user_model.UserRole.senior:
             raise HTTPException(status_code=403, detail="시니어만 초대코드를 생성할 수 있습니다.")
         
         # 그룹 초대코드 생성
         if connection_data.is_group_code:
-            invitation = invitation_helper.create_group_invitation_code(
+            invitation = await invitation_helper.create_group_invitation_code_async(
                 db=db,
-                inviter_id=current_user_id,
+                inviter_id=current_user.id,
                 relationship_type_id=connection_data.relationship_type_id
             )
         else:
             # 기존 개별 초대코드 생성
-            invitation = invitation_helper.create_invitation_code(
+            invitation = await invitation_helper.create_invitation_code_async(
                 db=db,
-                inviter_id=current_user_id,
+                inviter_id=current_user.id,
                 invitee_email=connection_data.invitee_email,
                 relationship_type_id=connection_data.relationship_type_id
             )
         
-        # 알림 발송
-        await send_notification_to_service("/api/v1/notifications/invite", {
-            "inviter_id": current_user_id,
-            "invitation_code": invitation.code,
-            "notification_type": "family_invitation"
-        })
         
         return invitation
         
@@ -152,31 +65,24 @@ async def create_invitation_code(
 @router.post("/invite-code/group", response_model=GroupInvitationCodeResponse)
 async def create_group_invitation_code(
     connection_data: GroupInvitationCodeCreate,
-    current_user_id: int = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """그룹 초대코드 생성 (시니어만 가능)"""
     try:
-        # 시니어 권한 확인
-        user = db.query(user_model.User).filter(user_model.User.id == current_user_id).first()
-        if not user or user.role != user_model.UserRole.senior:
+        # 시니어 권한 확인 (인증 의존성의 principal 사용, 추가 조회 없음)
+        if current_user.role != user_model.UserRole.senior:
             raise HTTPException(status_code=403, detail="시니어만 그룹 초대코드를 생성할 수 있습니다.")
         
         # 그룹 초대코드 생성
-        invitation = invitation_helper.create_group_invitation_code(
+        invitation = await invitation_helper.create_group_invitation_code_async(
             db=db,
-            inviter_id=current_user_id,
+            inviter_id=current_user.id,
             max_guardians=connection_data.max_guardians,
             relationship_type_id=connection_data.relationship_type_id,
             expires_in_days=connection_data.expires_in_days
         )
         
-        # 알림 발송
-        await send_notification_to_service("/api/v1/notifications/invite", {
-            "inviter_id": current_user_id,
-            "invitation_code": invitation.code,
-            "notification_type": "group_family_invitation"
-        })
         
         return invitation
         
@@ -186,12 +92,12 @@ async def create_group_invitation_code(
         raise HTTPException(status_code=500, detail=f"그룹 초대코드 생성 실패: {str(e)}")
 
 @router.get("/invite-code/{code}", response_model=InvitationCodeStatus)
-def get_invitation_code_status(
+async def get_invitation_code_status(
     code: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """초대코드 상태 확인 (인증 불필요)"""
-    invitation = invitation_helper.get_invitation_code_by_code(db, code)
+    invitation = await invitation_helper.get_invitation_code_by_code_async(db, code)
     
     if not invitation:
         return InvitationCodeStatus(
@@ -204,21 +110,22 @@ def get_invitation_code_status(
         )
     
     # 초대자 정보 조회
-    inviter = db.query(user_model.User).filter(user_model.User.id == invitation.inviter_id).first()
+    inviter = await db.get(user_model.User, invitation.inviter_id)
     inviter_name = inviter.full_name or inviter.username if inviter else None
     
     # 관계 유형 정보 조회
     relationship_type = None
     if invitation.relationship_type_id:
-        rel_type = db.query(user_model.RelationshipType).filter(
-            user_model.RelationshipType.id == invitation.relationship_type_id
-        ).first()
+        rel_type = await db.get(RelationshipType, invitation.relationship_type_id)
         relationship_type = rel_type.display_name_ko if rel_type else None
     
     return InvitationCodeStatus(
         code=invitation.code,
-        is_valid=not invitation.is_used and invitation.expires_at > datetime.utcnow(),
+        is_valid=invitation_helper.is_invitation_valid(invitation),
         is_used=invitation.is_used,
+        is_group_code=invitation.is_group_code,
+        max_guardians=invitation.max_guardians if invitation.is_group_code else None,
+        current_guardians=invitation.current_guardians if invitation.is_group_code else None,
         expires_at=invitation.expires_at,
         inviter_name=inviter_name,
         relationship_type=relationship_type
@@ -227,24 +134,17 @@ def get_invitation_code_status(
 @router.post("/connect", response_model=FamilyConnectResponse)
 async def connect_family(
     connection_data: FamilyConnectRequest,
-    current_user_id: int = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """초대코드로 가족 연결 (보호자만 가능)"""
     try:
-        family_relationship = invitation_helper.accept_invitation_code(
+        family_relationship = await invitation_helper.accept_invitation_code_async(
             db=db,
             code=connection_data.code,
-            guardian_user_id=current_user_id,
+            guardian_user_id=current_user.id,
             relationship_type_id=connection_data.relationship_type_id
         )
-        
-        # 가족 연결 시 notification 발송
-        await send_notification_to_service("/api/v1/notifications/connect", {
-            "guardian_id": current_user_id,
-            "senior_id": family_relationship.senior_id,
-            "relationship_type": family_relationship.relationship_type_id
-        })
 
         return FamilyConnectResponse(
             success=True,
@@ -258,60 +158,73 @@ async def connect_family(
             message=str(e),
             family_relationship_id=None
         )
+    except IntegrityError:
+        # 중복 연결 외 무결성 오류: 존재하지 않는 관계 유형 ID
+        raise HTTPException(status_code=400, detail="존재하지 않는 관계 유형입니다.")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"가족 연결 실패: {str(e)}")
 
 @router.get("/members", response_model=FamilyMembersResponse)
-def get_family_members(
-    current_user_id: int = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+async def get_family_members(
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """현재 사용자의 가족 구성원 조회"""
     try:
-        family_members = invitation_helper.get_user_family_members(db, current_user_id)
+        family_members = await invitation_helper.get_user_family_members_async(db, current_user.id)
         return FamilyMembersResponse(**family_members)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"가족 구성원 조회 실패: {str(e)}")
 
 @router.get("/invitations", response_model=InvitationCodeListResponse)
-def get_user_invitations(
-    skip: int = 0,
-    limit: int = 100,
-    current_user_id: int = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+async def get_user_invitations(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """사용자가 생성한 초대코드 목록 조회 (시니어만 가능)"""
+    """사용자가 생성한 초대코드 목록 조회 (시니어만 가능)
+
+    다음 페이지는 응답의 next_cursor를 cursor 파라미터로 전달해 조회합니다.
+    include_total=false이면 전체 개수 집계를 생략합니다. (total_count는 null)
+    """
     try:
-        invitations = invitation_helper.get_user_invitations(db, current_user_id, skip, limit)
-        total_count = len(invitations)
+        invitations, next_cursor, total_count = await invitation_helper.get_user_invitations_async(
+            db, current_user.id, skip, limit, cursor=cursor, include_total=include_total
+        )
         
         return InvitationCodeListResponse(
             invitations=invitations,
-            total_count=total_count
+            total_count=total_count,
+            next_cursor=next_cursor
         )
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"초대코드 목록 조회 실패: {str(e)}")
 
 @router.delete("/invitations/{invitation_id}")
-def delete_invitation(
+async def delete_invitation(
     invitation_id: int,
-    current_user_id: int = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """초대코드 삭제 (생성자만 가능)"""
     try:
-        invitation = db.query(Invitation).filter(Invitation.id == invitation_id).first()
+        invitation = await db.get(Invitation, invitation_id)
         
         if not invitation:
             raise HTTPException(status_code=404, detail="초대코드를 찾을 수 없습니다.")
         
-        if invitation.inviter_id != current_user_id:
+        if invitation.inviter_id != current_user.id:
             raise HTTPException(status_code=403, detail="초대코드 삭제 권한이 없습니다.")
         
-        db.delete(invitation)
-        db.commit()
+        await db.delete(invitation)
+        await db.commit()
         
         return {"message": "초대코드가 삭제되었습니다."}
         
@@ -321,18 +234,23 @@ def delete_invitation(
         raise HTTPException(status_code=500, detail=f"초대코드 삭제 실패: {str(e)}")
 
 @router.post("/cleanup")
-def cleanup_expired_invitations(
-    current_user_id: int = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+async def cleanup_expired_invitations(
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """만료된 초대코드 정리 (관리자 기능)"""
+    """만료된 초대코드 정리 (관리자 기능, 주기 작업과 같은 배치 만료 처리를 즉시 한 번 실행)
+
+    보관 기간이 지난 초대코드 삭제는 주기 작업에서만 수행합니다. (일반 사용자 호출로 행이 삭제되지 않도록)
+    """
     try:
         # 실제로는 관리자 권한 확인 필요
-        expired_count = invitation_helper.cleanup_expired_invitations(db)
+        result = await invitation_helper.sweep_expired_invitations_async(db, retention_days=0)
+        expired_count = result["expired"]
         
         return {
             "message": f"{expired_count}개의 만료된 초대코드가 정리되었습니다.",
-            "expired_count": expired_count
+            "expired_count": expired_count,
+            **result
         }
         
     except Exception as e:
@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Response
+
+from app.config.config import get_config
+from app.utils import security
+
+router = APIRouter(
+    prefix="/.well-known",
+    tags=["Auth"]
+)
+
+JWKS_CACHE_SECONDS = get_config().JWKS_CACHE_SECONDS
+
+@router.get("/jwks.json")
+def get_jwks(response: Response):
+    """액세스 토큰 검증용 공개키 목록 (JWKS)
+
+    다른 서비스는 이 키로 토큰을 직접 검증하므로 /auth/verify 호출이 필요 없습니다.
+    HS256(공유 비밀키) 모드에서는 공개할 키가 없어 빈 목록을 반환합니다.
+    """
+    response.headers["Cache-Control"] = f"public, max-age={JWKS_CACHE_SECONDS}"
+    if security.key_ring is None:
+        return {"keys": []}
+    return security.key_ring.jwks()
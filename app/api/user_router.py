@@ -1,12 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from app.models.user import UserRole
-from starlette.concurrency import run_in_threadpool # run_in_threadpool 임포트
 
 from app.schemas import user_schema
 from app.models import user as user_model
-from app.utils.db import get_db
+from app.utils.db import get_async_db
+from app.utils.pagination import MAX_PAGE_SIZE
 
 router = APIRouter(
     prefix="/users",
@@ -16,44 +17,64 @@ router = APIRouter(
 from app.helper import user_helper
 
 @router.post("/", response_model=user_schema.User)
-async def create_user(user: user_schema.UserCreate, db: Session = Depends(get_db)):
-    return await run_in_threadpool(user_helper.create_user, db=db, user=user)
+async def create_user(user: user_schema.UserCreate, db: AsyncSession = Depends(get_async_db)):
+    return await user_helper.create_user_async(db=db, user=user)
 
 @router.get("/{user_id}", response_model=user_schema.User)
-async def get_user(user_id: int, db: Session = Depends(get_db)):
-    user = await run_in_threadpool(user_helper.get_user, db=db, user_id=user_id)
+async def get_user(user_id: int, db: AsyncSession = Depends(get_async_db)):
+    user = await user_helper.get_user_async(db=db, user_id=user_id)
     if user is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     return user
 
 @router.get("/", response_model=List[user_schema.User])
-async def get_users(skip: int = 0, limit: int = 100, role: Optional[UserRole] = None, db: Session = Depends(get_db)):
-    return await run_in_threadpool(user_helper.get_users, db=db, skip=skip, limit=limit, role=role)
+async def get_users(
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    role: Optional[UserRole] = None,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """사용자 목록 조회
+
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환합니다. (다음 요청의 cursor 파라미터로 전달)
+    skip은 기존 클라이언트 호환용이며 cursor가 있으면 무시됩니다.
+    """
+    try:
+        users, next_cursor = await user_helper.get_users_async(
+            db=db, skip=skip, limit=limit, role=role, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return users
 
 @router.put("/{user_id}", response_model=user_schema.User)
-async def update_user(user_id: int, user: user_schema.UserUpdate, db: Session = Depends(get_db)):
-    db_user = await run_in_threadpool(user_helper.update_user, db=db, user_id=user_id, user_update=user)
+async def update_user(user_id: int, user: user_schema.UserUpdate, db: AsyncSession = Depends(get_async_db)):
+    db_user = await user_helper.update_user_async(db=db, user_id=user_id, user_update=user)
     if db_user is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     return db_user
 
 @router.delete("/{user_id}", response_model=user_schema.User)
-async def delete_user(user_id: int, db: Session = Depends(get_db)):
-    db_user = await run_in_threadpool(user_helper.delete_user, db=db, user_id=user_id)
+async def delete_user(user_id: int, db: AsyncSession = Depends(get_async_db)):
+    db_user = await user_helper.delete_user_async(db=db, user_id=user_id)
     if db_user is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     return db_user
 
 @router.get("/guardian/{guardian_id}/seniors", response_model=List[user_schema.SeniorInfo])
-async def get_seniors_for_guardian(guardian_id: int, db: Session = Depends(get_db)):
-    seniors = await run_in_threadpool(user_helper.get_seniors_by_guardian_id, db=db, guardian_id=guardian_id)
+async def get_seniors_for_guardian(guardian_id: int, db: AsyncSession = Depends(get_async_db)):
+    seniors = await user_helper.get_seniors_by_guardian_id_async(db=db, guardian_id=guardian_id)
     if not seniors:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Seniors not found for this guardian.")
     return seniors
 
 @router.get("/{senior_id}/guardians", response_model=List[user_schema.GuardianInfo])
-async def get_guardians_for_senior(senior_id: int, db: Session = Depends(get_db)):
-    guardians = await run_in_threadpool(user_helper.get_guardians_for_senior, db=db, senior_id=senior_id)
+async def get_guardians_for_senior(senior_id: int, db: AsyncSession = Depends(get_async_db)):
+    guardians = await user_helper.get_guardians_for_senior_async(db=db, senior_id=senior_id)
     if not guardians:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Guardians not found for this senior")
     return guardians
@@ -61,7 +82,13 @@ async def get_guardians_for_senior(senior_id: int, db: Session = Depends(get_db)
 @router.post("/family-relationships", response_model=user_schema.FamilyRelationshipResponse)
 async def create_family_relationship(
     relationship: user_schema.FamilyRelationshipCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    db_relationship = await run_in_threadpool(user_helper.create_family_relationship, db=db, relationship=relationship)
-    return db_relationship
\ No newline at end of file
+    try:
+        db_relationship = await user_helper.create_family_relationship_async(db=db, relationship=relationship)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except IntegrityError:
+        # 중복 외 무결성 오류: 존재하지 않는 시니어/보호자/관계 유형 ID
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="존재하지 않는 사용자 또는 관계 유형입니다.")
+    return db_relationship
@@ -9,6 +9,79 @@ class Config(object):
     
     # 환경변수에서 로드
     DATABASE_URL = os.environ.get('DATABASE_URL')
+
+    # 커넥션 풀 설정 (레플리카별로 환경변수로 조정)
+    DB_POOL_MODE = os.environ.get('DB_POOL_MODE', 'queue')  # queue | null (외부 pgbouncer 사용 시 null)
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', '10'))
+    DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', '10'))
+    DB_POOL_TIMEOUT = int(os.environ.get('DB_POOL_TIMEOUT', '10'))  # 커넥션 대기 최대 시간(초)
+    DB_POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE', '1800'))  # 커넥션 재생성 주기(초), 풀러의 idle timeout보다 짧게
+    DB_POOL_PRE_PING = os.environ.get('DB_POOL_PRE_PING', 'true').lower() == 'true'
+    DB_STATEMENT_TIMEOUT_MS = int(os.environ.get('DB_STATEMENT_TIMEOUT_MS', '0'))  # 0이면 서버 기본값 사용
+
+    # 인증 사용자(principal) 캐시 설정
+    USER_CACHE_MAXSIZE = int(os.environ.get('USER_CACHE_MAXSIZE', '10000'))
+    USER_CACHE_TTL_SECONDS = int(os.environ.get('USER_CACHE_TTL_SECONDS', '60'))
+    # 검증된 JWT 캐시 (토큰 -> claims, 토큰의 exp 시점에 만료)
+    TOKEN_CACHE_MAXSIZE = int(os.environ.get('TOKEN_CACHE_MAXSIZE', '50000'))
+    TOKEN_BATCH_MAX = int(os.environ.get('TOKEN_BATCH_MAX', '100'))  # /auth/verify/batch 최대 토큰 수
+
+    # 리프레시 토큰 (액세스 토큰은 짧게, 리프레시 토큰은 회전하며 재발급)
+    REFRESH_TOKEN_EXPIRE_DAYS = int(os.environ.get('REFRESH_TOKEN_EXPIRE_DAYS', '30'))
+    # 만료/폐기된 리프레시 토큰 정리 (폐기된 토큰은 재사용 감지와 로그아웃 안내를 위해 보관 기간 동안 유지)
+    REFRESH_TOKEN_PURGE_SECONDS = int(os.environ.get('REFRESH_TOKEN_PURGE_SECONDS', '3600'))
+    REFRESH_TOKEN_PURGE_BATCH_SIZE = int(os.environ.get('REFRESH_TOKEN_PURGE_BATCH_SIZE', '1000'))
+    REFRESH_TOKEN_PURGE_MAX_BATCHES = int(os.environ.get('REFRESH_TOKEN_PURGE_MAX_BATCHES', '50'))  # 1회 실행당 최대 배치 수
+    REFRESH_TOKEN_REVOKED_RETENTION_DAYS = int(os.environ.get('REFRESH_TOKEN_REVOKED_RETENTION_DAYS', '7'))
+
+    # JWT 서명 (RS256/EdDSA 사용 시 다른 서비스가 JWKS 공개키로 직접 검증)
+    JWT_ALGORITHM = os.environ.get('JWT_ALGORITHM', 'HS256')  # HS256 | RS256 | EdDSA
+    JWT_KEYS_DIR = os.environ.get('JWT_KEYS_DIR')  # <kid>.pem 개인키 파일 디렉토리
+    JWT_ACTIVE_KID = os.environ.get('JWT_ACTIVE_KID')  # 새 토큰 서명에 사용할 키 ID
+    JWKS_CACHE_SECONDS = int(os.environ.get('JWKS_CACHE_SECONDS', '300'))
+
+    # 액세스 토큰 폐기 목록 동기화/정리 주기(초)
+    REVOCATION_SYNC_SECONDS = int(os.environ.get('REVOCATION_SYNC_SECONDS', '5'))
+    REVOCATION_PURGE_SECONDS = int(os.environ.get('REVOCATION_PURGE_SECONDS', '3600'))
+
+    # 만료 초대코드 정리 (주기 작업, 한 번에 batch 크기만큼 처리해 잠금 시간을 짧게 유지)
+    INVITATION_SWEEP_SECONDS = int(os.environ.get('INVITATION_SWEEP_SECONDS', '60'))
+    INVITATION_SWEEP_BATCH_SIZE = int(os.environ.get('INVITATION_SWEEP_BATCH_SIZE', '1000'))
+    INVITATION_SWEEP_MAX_BATCHES = int(os.environ.get('INVITATION_SWEEP_MAX_BATCHES', '50'))  # 1회 실행당 최대 배치 수
+    INVITATION_RETENTION_DAYS = int(os.environ.get('INVITATION_RETENTION_DAYS', '0'))  # 만료 후 보관 기간, 0이면 삭제 안 함
+
+    # SQL 실행 집계 디버그: 요청마다 가장 느린 SQL을 정규화(fingerprint)해 로그에 기록
+    SQL_SLOW_QUERY_LOG = os.environ.get('SQL_SLOW_QUERY_LOG', 'false').lower() == 'true'
+    SQL_SLOW_QUERY_TOP_N = int(os.environ.get('SQL_SLOW_QUERY_TOP_N', '3'))
+
+    # notification-service 알림 발송 (outbox에 기록 후 백그라운드에서 발송)
+    NOTIFICATION_SERVICE_URL = os.environ.get('NOTIFICATION_SERVICE_URL', 'http://localhost:8002')
+    NOTIFICATION_TIMEOUT_SECONDS = float(os.environ.get('NOTIFICATION_TIMEOUT_SECONDS', '5'))
+    NOTIFICATION_MAX_CONNECTIONS = int(os.environ.get('NOTIFICATION_MAX_CONNECTIONS', '20'))
+    NOTIFICATION_SEND_RETRIES = int(os.environ.get('NOTIFICATION_SEND_RETRIES', '3'))  # 한 번의 발송에서 즉시 재시도 횟수
+    NOTIFICATION_DISPATCH_SECONDS = float(os.environ.get('NOTIFICATION_DISPATCH_SECONDS', '1'))
+    NOTIFICATION_DISPATCH_BATCH_SIZE = int(os.environ.get('NOTIFICATION_DISPATCH_BATCH_SIZE', '100'))
+    # 묶음 발송 최대 이벤트 수, 1이면 단건 발송 (notification-service가 {endpoint}/batch를 지원할 때만 늘릴 것)
+    NOTIFICATION_BATCH_MAX_EVENTS = int(os.environ.get('NOTIFICATION_BATCH_MAX_EVENTS', '1'))
+    NOTIFICATION_BATCH_WINDOW_SECONDS = float(os.environ.get('NOTIFICATION_BATCH_WINDOW_SECONDS', '0.5'))  # 묶음을 채우기 위해 기다리는 최대 시간
+    NOTIFICATION_MAX_ATTEMPTS = int(os.environ.get('NOTIFICATION_MAX_ATTEMPTS', '10'))  # 초과 시 발송 포기
+    NOTIFICATION_BACKOFF_MAX_SECONDS = int(os.environ.get('NOTIFICATION_BACKOFF_MAX_SECONDS', '600'))
+    # 서킷 브레이커: 연속 실패 시 호출 차단, 일정 시간 후 시험 호출로 복구 확인
+    NOTIFICATION_BREAKER_FAILURE_THRESHOLD = int(os.environ.get('NOTIFICATION_BREAKER_FAILURE_THRESHOLD', '5'))
+    NOTIFICATION_BREAKER_RESET_SECONDS = float(os.environ.get('NOTIFICATION_BREAKER_RESET_SECONDS', '30'))
+    NOTIFICATION_BREAKER_HALF_OPEN_CALLS = int(os.environ.get('NOTIFICATION_BREAKER_HALF_OPEN_CALLS', '1'))
+    NOTIFICATION_PURGE_SECONDS = float(os.environ.get('NOTIFICATION_PURGE_SECONDS', '3600'))
+    NOTIFICATION_RETENTION_HOURS = int(os.environ.get('NOTIFICATION_RETENTION_HOURS', '24'))  # 발송 완료 알림 보관 기간
+
+    # 비밀번호 해시 설정 (해시는 CPU 작업이므로 별도 프로세스 풀에서 실행)
+    # 저장된 해시의 알고리즘/파라미터가 아래 목표값과 다르면 로그인 성공 시 자동 재해시
+    PASSWORD_HASH_SCHEME = os.environ.get('PASSWORD_HASH_SCHEME', 'bcrypt')  # bcrypt | argon2id
+    BCRYPT_ROUNDS = int(os.environ.get('BCRYPT_ROUNDS', '12'))
+    ARGON2_TIME_COST = int(os.environ.get('ARGON2_TIME_COST', '2'))
+    ARGON2_MEMORY_COST = int(os.environ.get('ARGON2_MEMORY_COST', '19456'))  # KiB
+    ARGON2_PARALLELISM = int(os.environ.get('ARGON2_PARALLELISM', '1'))
+    HASH_WORKERS = int(os.environ.get('HASH_WORKERS', str(os.cpu_count() or 1)))
+    HASH_QUEUE_SIZE = int(os.environ.get('HASH_QUEUE_SIZE', '64'))  # 워커 수를 넘는 대기 허용량, 초과 시 503
     
     # 로깅 설정
     LOG_LEVEL = logging.INFO
@@ -32,9 +105,16 @@ class TestingConfig(Config):
     LOG_LEVEL = logging.DEBUG
     LOG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'logs')
     DATABASE_URL = 'sqlite:///test.db'
+    DB_POOL_SIZE = 5
+    DB_MAX_OVERFLOW = 5
+    BCRYPT_ROUNDS = 4  # 테스트 속도를 위해 최소 비용 사용
 
 config_by_name = dict(
     development=DevelopmentConfig,
     test=TestingConfig,
     production=ProductionConfig,
 )
+
+def get_config(config_name: str = None):
+    """설정 클래스 반환 (미지정 시 PHASE 환경변수 기준)"""
+    return config_by_name.get(config_name or os.environ.get('PHASE') or 'development', Config)
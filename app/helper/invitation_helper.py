@@ -1,237 +1,390 @@
-import random
+import logging
+import secrets
 import string
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, case, delete, func, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.invitation import Invitation
 from app.models.user import User, UserRole, FamilyRelationship
 from app.models.relationship_type import RelationshipType
+from app.config.config import get_config
+from app.helper import user_helper
+from app.helper.notification_helper import CONNECT_ENDPOINT, INVITE_ENDPOINT, enqueue_notification
+from app.utils.pagination import keyset_query, split_page
+
+logger = logging.getLogger(__name__)
+
+_config = get_config()
+
+# 숫자와 대문자만 사용 (0, O, 1, I 등 혼동 문자 제외, 32자 -> 8자리 코드 약 1조 가지)
+INVITATION_CODE_ALPHABET = string.ascii_uppercase.replace('O', '').replace('I', '') + string.digits.replace('0', '').replace('1', '')
+INVITATION_CODE_LENGTH = 8
+INVITATION_CODE_ATTEMPTS = 5  # 코드 충돌 시 재시도 횟수
 
 def generate_invitation_code() -> str:
     """8자리 랜덤 초대코드 생성"""
-    return ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
+    return ''.join(secrets.choice(INVITATION_CODE_ALPHABET) for _ in range(INVITATION_CODE_LENGTH))
+
+def _is_code_collision(error: IntegrityError) -> bool:
+    # PostgreSQL: ix_invitations_code 유니크 인덱스 위반, SQLite: UNIQUE constraint failed: invitations.code
+    message = str(error.orig)
+    return "ix_invitations_code" in message or "invitations.code" in message
+
+def _expire_previous_statement(inviter_id: int):
+    """사용자의 유효한 기존 초대코드를 한 번에 사용 처리 (객체 로드 없이 UPDATE 1회)"""
+    now = datetime.utcnow()
+    return update(Invitation).where(
+        Invitation.inviter_id == inviter_id,
+        Invitation.is_used == False,
+        Invitation.expires_at > now
+    ).values(is_used=True, used_at=now).execution_options(synchronize_session=False)
+
+def _deactivate_previous_group_statement(inviter_id: int):
+    """사용자의 활성 그룹 초대코드를 한 번에 비활성화 (객체 로드 없이 UPDATE 1회)"""
+    return update(Invitation).where(
+        Invitation.inviter_id == inviter_id,
+        Invitation.is_group_code == True,
+        Invitation.is_active == True
+    ).values(is_active=False).execution_options(synchronize_session=False)
+
+def _enqueue_connect_notification(db, family_relationship: FamilyRelationship):
+    # 가족 연결 알림도 같은 트랜잭션으로 outbox에 기록 (연결이 롤백되면 알림도 남지 않음)
+    enqueue_notification(db, CONNECT_ENDPOINT, {
+        "guardian_id": family_relationship.guardian_id,
+        "senior_id": family_relationship.senior_id,
+        "relationship_type": family_relationship.relationship_type_id
+    })
+
+def _enqueue_invite_notification(db, invitation: Invitation, notification_type: str):
+    # 초대 알림은 같은 트랜잭션에서 outbox에 기록되어 초대코드와 함께 커밋/롤백됨 (충돌 재시도마다 다시 추가)
+    enqueue_notification(db, INVITE_ENDPOINT, {
+        "inviter_id": invitation.inviter_id,
+        "invitation_code": invitation.code,
+        "notification_type": notification_type
+    })
+
+async def _save_with_unique_code_async(db: AsyncSession, invitation: Invitation, prepare, notification_type: str) -> Invitation:
+    """중복 확인 조회 없이 바로 INSERT하고, 코드 유니크 제약 위반 시에만 새 코드로 재시도
+
+    prepare: 같은 트랜잭션에서 INSERT 전에 실행할 코루틴 함수 (충돌 시 함께 롤백되므로 재시도마다 다시 실행)
+    """
+    for _ in range(INVITATION_CODE_ATTEMPTS):
+        await prepare()
+        invitation.code = generate_invitation_code()
+        db.add(invitation)
+        _enqueue_invite_notification(db, invitation, notification_type)
+        try:
+            await db.commit()
+            return invitation
+        except IntegrityError as e:
+            await db.rollback()
+            if not _is_code_collision(e):
+                raise
+    raise RuntimeError("초대코드 생성에 실패했습니다. 잠시 후 다시 시도해주세요.")
 
-def create_invitation_code(
-    db: Session, 
-    inviter_id: int, 
+def _claim_invitation_statement(code: str, now: datetime):
+    """초대코드 사용 처리 조건부 UPDATE (수락 가능할 때만 1건 갱신, 초대자/관계 유형 반환)
+    - 그룹 코드: 활성 상태이고 current_guardians < max_guardians 일 때만 1 증가
+    - 개별 코드: 미사용일 때만 사용 처리
+    """
+    current_guardians = func.coalesce(Invitation.current_guardians, 0)
+    return (
+        update(Invitation)
+        .where(
+            Invitation.code == code,
+            Invitation.expires_at > now,
+            or_(
+                and_(
+                    Invitation.is_group_code == True,
+                    Invitation.is_active == True,
+                    current_guardians < Invitation.max_guardians
+                ),
+                and_(Invitation.is_group_code == False, Invitation.is_used == False)
+            )
+        )
+        .values(
+            current_guardians=current_guardians + 1,
+            is_used=case((Invitation.is_group_code == True, Invitation.is_used), else_=True),
+            used_at=case((Invitation.is_group_code == True, Invitation.used_at), else_=now)
+        )
+        .returning(Invitation.inviter_id, Invitation.relationship_type_id)
+        .execution_options(synchronize_session=False)
+    )
+
+def _family_members_query(user_id: int):
+    """양방향 가족 구성원을 한 번에 조회하는 단일 쿼리
+
+    사용자가 시니어 쪽이면 보호자를, 보호자 쪽이면 시니어를 상대방으로 조인하고
+    관계 유형 이름도 같은 쿼리에서 가져옵니다. (구성원 수와 무관하게 1회 왕복)
+    """
+    member_id = case(
+        (FamilyRelationship.senior_id == user_id, FamilyRelationship.guardian_id),
+        else_=FamilyRelationship.senior_id
+    )
+    return (
+        select(
+            FamilyRelationship.senior_id,
+            User.id,
+            User.username,
+            User.full_name,
+            RelationshipType.display_name_ko.label("relationship_type")
+        )
+        .join(User, User.id == member_id)
+        .outerjoin(RelationshipType, RelationshipType.id == FamilyRelationship.relationship_type_id)
+        .where(or_(FamilyRelationship.senior_id == user_id, FamilyRelationship.guardian_id == user_id))
+        .order_by(FamilyRelationship.id)
+    )
+
+def _group_family_members(rows, user_id: int) -> dict:
+    members = {"seniors": [], "guardians": []}
+    for row in rows:
+        # 내가 시니어인 관계의 상대방은 보호자
+        key = "guardians" if row.senior_id == user_id else "seniors"
+        members[key].append({
+            "id": row.id,
+            "username": row.username,
+            "full_name": row.full_name,
+            "relationship_type": row.relationship_type
+        })
+    return members
+
+async def create_invitation_code_async(
+    db: AsyncSession,
+    inviter_id: int,
     invitee_email: str = None,
     relationship_type_id: int = None,
     expires_hours: int = 24
 ) -> Invitation:
     """초대코드 생성 및 저장"""
-    
+
     # 시니어 사용자인지 확인
-    senior_user = db.query(User).filter(User.id == inviter_id).first()
+    senior_user = await user_helper.get_user_principal_async(db, inviter_id)
     if not senior_user or senior_user.role != UserRole.senior:
         raise ValueError("시니어 사용자만 초대코드를 생성할 수 있습니다.")
-    
+
     # 기존에 만료되지 않은 초대코드가 있다면 만료 처리
-    existing_invitations = db.query(Invitation).filter(
-        Invitation.inviter_id == inviter_id,
-        Invitation.is_used == False,
-        Invitation.expires_at > datetime.utcnow()
-    ).all()
-    
-    for inv in existing_invitations:
-        inv.is_used = True
-        inv.used_at = datetime.utcnow()
-    
-    # 새로운 초대코드 생성
-    while True:
-        code = generate_invitation_code()
-        # 중복 코드 확인
-        if not db.query(Invitation).filter(Invitation.code == code).first():
-            break
-    
-    # 초대코드 저장
+    async def expire_previous():
+        await db.execute(_expire_previous_statement(inviter_id))
+
     invitation = Invitation(
-        code=code,
         inviter_id=inviter_id,
         invitee_email=invitee_email,
         relationship_type_id=relationship_type_id,
         is_used=False,
         expires_at=datetime.utcnow() + timedelta(hours=expires_hours),
-        is_group_code=False,  # 개별 초대코드임을 명시
-        max_guardians=1,  # 개별 초대코드는 최대 1명
+        is_group_code=False,
+        max_guardians=1,
         current_guardians=0,
         is_active=True
     )
-    
-    db.add(invitation)
-    db.commit()
-    db.refresh(invitation)
-    
+
+    await _save_with_unique_code_async(db, invitation, expire_previous, "family_invitation")
+    await db.refresh(invitation)
+
     return invitation
 
-def create_group_invitation_code(
-    db: Session, 
-    inviter_id: int, 
+async def create_group_invitation_code_async(
+    db: AsyncSession,
+    inviter_id: int,
     max_guardians: int = 10,
     relationship_type_id: int = None,
     expires_in_days: int = 30
 ) -> Invitation:
     """그룹 초대코드 생성 및 저장 (여러 보호자 연결 가능)"""
-    
+
     # 시니어 사용자인지 확인
-    inviter_user = db.query(User).filter(User.id == inviter_id).first()
+    inviter_user = await user_helper.get_user_principal_async(db, inviter_id)
     if not inviter_user or inviter_user.role != UserRole.senior:
         raise ValueError("시니어 사용자만 그룹 초대코드를 생성할 수 있습니다.")
-    
+
     # 기존에 활성화된 그룹 초대코드가 있다면 비활성화
-    existing_group_invitations = db.query(Invitation).filter(
-        Invitation.inviter_id == inviter_id,
-        Invitation.is_group_code == True,
-        Invitation.is_active == True
-    ).all()
-    
-    for inv in existing_group_invitations:
-        inv.is_active = False
-    
-    # 새로운 그룹 초대코드 생성
-    while True:
-        code = generate_invitation_code()
-        # 중복 코드 확인
-        if not db.query(Invitation).filter(Invitation.code == code).first():
-            break
-    
-    # 그룹 초대코드 저장
+    async def deactivate_previous():
+        await db.execute(_deactivate_previous_group_statement(inviter_id))
+
     invitation = Invitation(
-        code=code,
         inviter_id=inviter_id,
-        invitee_email=None,  # 그룹 초대코드는 이메일 불필요
+        invitee_email=None,
         relationship_type_id=relationship_type_id,
-        is_used=False,  # 그룹 초대코드는 is_used 대신 is_active 사용
+        is_used=False,
         expires_at=datetime.utcnow() + timedelta(days=expires_in_days),
-        used_at=None,  # 그룹 초대코드는 used_at 불필요
-        is_group_code=True,  # 그룹 초대코드임을 명시
+        used_at=None,
+        is_group_code=True,
         max_guardians=max_guardians,
         current_guardians=0,
         is_active=True
     )
-    
-    db.add(invitation)
-    db.commit()
-    db.refresh(invitation)
-    
+
+    await _save_with_unique_code_async(db, invitation, deactivate_previous, "group_family_invitation")
+    await db.refresh(invitation)
+
     return invitation
 
-def get_invitation_code_by_code(db: Session, code: str) -> Invitation:
+async def get_invitation_code_by_code_async(db: AsyncSession, code: str) -> Invitation:
     """코드로 초대 정보 조회"""
-    return db.query(Invitation).filter(Invitation.code == code).first()
+    result = await db.execute(select(Invitation).where(Invitation.code == code))
+    return result.scalars().first()
 
-def accept_invitation_code(
-    db: Session, 
-    code: str, 
+def is_invitation_valid(invitation: Invitation, now: datetime = None) -> bool:
+    """초대코드 사용 가능 여부 (그룹 코드는 활성 상태 + 정원 여유, 개별 코드는 미사용)"""
+    if invitation.expires_at <= (now or datetime.utcnow()):
+        return False
+    if invitation.is_group_code:
+        return invitation.is_active and (invitation.current_guardians or 0) < (invitation.max_guardians or 0)
+    return not invitation.is_used
+
+def _rejection_reason(invitation: Invitation, now: datetime) -> str:
+    """초대코드 수락이 거절된 이유 (조건부 UPDATE가 0건일 때만 조회)"""
+    if invitation is None:
+        return "유효하지 않은 초대코드입니다."
+    if invitation.expires_at <= now:
+        return "만료된 초대코드입니다."
+    if invitation.is_group_code:
+        if not invitation.is_active:
+            return "비활성화된 초대코드입니다."
+        return "초대코드의 최대 보호자 수에 도달했습니다."
+    return "이미 사용된 초대코드입니다."
+
+async def accept_invitation_code_async(
+    db: AsyncSession,
+    code: str,
     guardian_user_id: int,
     relationship_type_id: int = None
 ) -> FamilyRelationship:
-    """초대코드로 가족 연결 수락"""
-    
+    """초대코드로 가족 연결 수락
+
+    초대코드 사용 처리는 조건부 UPDATE 한 번으로 원자적으로 수행합니다. (_claim_invitation_statement)
+    동시에 여러 보호자가 수락해도 정원을 넘지 않으며, 조건을 만족하지 못하면 0건이 갱신됩니다.
+    """
+
     # 보호자 사용자인지 확인
-    guardian_user = db.query(User).filter(User.id == guardian_user_id).first()
+    guardian_user = await user_helper.get_user_principal_async(db, guardian_user_id)
     if not guardian_user or guardian_user.role != UserRole.guardian:
         raise ValueError("보호자 사용자만 초대코드를 수락할 수 있습니다.")
-    
-    # 초대코드 조회 및 검증
-    invitation = get_invitation_code_by_code(db, code)
-    if not invitation:
-        raise ValueError("유효하지 않은 초대코드입니다.")
-    
-    if invitation.is_used:
-        raise ValueError("이미 사용된 초대코드입니다.")
-    
-    if invitation.expires_at < datetime.utcnow():
-        raise ValueError("만료된 초대코드입니다.")
-    
-    # 시니어와 보호자가 이미 연결되어 있는지 확인
-    existing_relationship = db.query(FamilyRelationship).filter(
-        FamilyRelationship.senior_id == invitation.inviter_id,
-        FamilyRelationship.guardian_id == guardian_user_id
-    ).first()
-    
-    if existing_relationship:
-        raise ValueError("이미 연결된 가족 관계입니다.")
-    
-    # 가족 관계 생성
+
+    now = datetime.utcnow()
+    claimed = (await db.execute(_claim_invitation_statement(code, now))).first()
+
+    if claimed is None:
+        await db.rollback()
+        raise ValueError(_rejection_reason(await get_invitation_code_by_code_async(db, code), now))
+
+    # 가족 관계 생성 (이미 연결된 경우 (senior_id, guardian_id) 유니크 제약 위반, 없는 관계 유형이면 외래키 위반
+    # -> 어느 쪽이든 사용 처리도 함께 롤백)
     family_relationship = FamilyRelationship(
-        senior_id=invitation.inviter_id,
+        senior_id=claimed.inviter_id,
         guardian_id=guardian_user_id,
-        relationship_type_id=relationship_type_id or invitation.relationship_type_id
+        relationship_type_id=relationship_type_id or claimed.relationship_type_id
     )
-    
     db.add(family_relationship)
-    
-    # 초대코드 사용 처리
-    invitation.is_used = True
-    invitation.used_at = datetime.utcnow()
-    
-    db.commit()
-    db.refresh(family_relationship)
-    
+    _enqueue_connect_notification(db, family_relationship)
+
+    try:
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        if user_helper.is_duplicate_family_relationship(e):
+            raise ValueError("이미 연결된 가족 관계입니다.")
+        raise
+    await db.refresh(family_relationship)
+
     return family_relationship
 
-def get_user_family_members(db: Session, user_id: int) -> dict:
+async def get_user_family_members_async(db: AsyncSession, user_id: int) -> dict:
     """사용자의 가족 구성원 조회"""
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        return {"seniors": [], "guardians": []}
-    
-    if user.role == UserRole.senior:
-        # 시니어인 경우: 자신을 돌보는 보호자들
-        guardians = db.query(FamilyRelationship).filter(
-            FamilyRelationship.senior_id == user_id
-        ).all()
-        
-        guardian_users = []
-        for rel in guardians:
-            guardian = db.query(User).filter(User.id == rel.guardian_id).first()
-            if guardian:
-                guardian_users.append({
-                    "id": guardian.id,
-                    "username": guardian.username,
-                    "full_name": guardian.full_name,
-                    "relationship_type": rel.relationship_type.display_name_ko if rel.relationship_type else None
-                })
-        
-        return {"seniors": [], "guardians": guardian_users}
-    
-    else:
-        # 보호자인 경우: 자신이 돌보는 시니어들
-        seniors = db.query(FamilyRelationship).filter(
-            FamilyRelationship.guardian_id == user_id
-        ).all()
-        
-        senior_users = []
-        for rel in seniors:
-            senior = db.query(User).filter(User.id == rel.senior_id).first()
-            if senior:
-                senior_users.append({
-                    "id": senior.id,
-                    "username": senior.username,
-                    "full_name": senior.full_name,
-                    "relationship_type": rel.relationship_type.display_name_ko if rel.relationship_type else None
-                })
-        
-        return {"seniors": senior_users, "guardians": []}
-
-def get_user_invitations(db: Session, user_id: int, skip: int = 0, limit: int = 100) -> list:
-    """사용자가 생성한 초대코드 목록 조회"""
-    invitations = db.query(Invitation).filter(
-        Invitation.inviter_id == user_id
-    ).order_by(Invitation.created_at.desc()).offset(skip).limit(limit).all()
-    
-    return invitations
-
-def cleanup_expired_invitations(db: Session) -> int:
-    """만료된 초대코드 정리"""
-    expired_count = db.query(Invitation).filter(
-        Invitation.expires_at < datetime.utcnow(),
-        Invitation.is_used == False
-    ).count()
-    
-    db.query(Invitation).filter(
-        Invitation.expires_at < datetime.utcnow(),
-        Invitation.is_used == False
-    ).update({"is_used": True, "used_at": datetime.utcnow()})
-    
-    db.commit()
-    return expired_count
+    rows = (await db.execute(_family_members_query(user_id))).all()
+    return _group_family_members(rows, user_id)
+
+async def get_user_invitations_async(
+    db: AsyncSession,
+    user_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str = None,
+    include_total: bool = True
+) -> tuple:
+    """사용자가 생성한 초대코드 목록 조회 (최신순)
+
+    전체 개수는 같은 쿼리의 스칼라 서브쿼리 컬럼으로 함께 조회합니다. (inviter_id 인덱스만 읽음)
+    반환값: (초대코드 목록, 다음 페이지 커서 또는 None, 전체 개수 또는 None)
+    """
+    owned = Invitation.inviter_id == user_id
+    query = select(Invitation).where(owned)
+    if include_total:
+        # 윈도 함수(count() over ())는 커서 조건이 적용된 나머지 행만 세므로 사용자 전체 기준 서브쿼리 사용
+        query = query.add_columns(
+            select(func.count()).select_from(Invitation).where(owned).scalar_subquery().label("total_count")
+        )
+    query = keyset_query(query, Invitation.created_at, Invitation.id, limit, cursor=cursor, skip=skip, descending=True)
+    rows = (await db.execute(query)).all()
+    invitations, next_cursor = split_page([row[0] for row in rows], limit)
+
+    total_count = None
+    if include_total:
+        if rows:
+            total_count = rows[0].total_count
+        elif skip or cursor:
+            # 마지막 페이지를 넘어선 경우에만 별도 집계
+            total_count = (await db.execute(select(func.count()).select_from(Invitation).where(owned))).scalar()
+        else:
+            total_count = 0
+    return invitations, next_cursor, total_count
+
+def _sweep_batch_ids(condition, batch_size: int):
+    # 다른 레플리카의 정리 작업과 같은 행을 기다리지 않도록 잠긴 행은 건너뜀 (SQLite는 FOR UPDATE 무시)
+    return select(Invitation.id).where(condition).limit(batch_size).with_for_update(skip_locked=True).scalar_subquery()
+
+async def _run_batches(db: AsyncSession, make_statement, max_batches: int, batch_size: int) -> tuple:
+    """배치 단위로 실행 후 즉시 커밋 (반환값: (처리 건수, 실행 배치 수, 남은 작업 여부))"""
+    total = 0
+    for batch in range(1, max_batches + 1):
+        result = await db.execute(make_statement())
+        await db.commit()
+        total += result.rowcount
+        if result.rowcount < batch_size:
+            return total, batch, False
+    return total, max_batches, True
+
+async def sweep_expired_invitations_async(
+    db: AsyncSession,
+    batch_size: int = None,
+    max_batches: int = None,
+    retention_days: int = None
+) -> dict:
+    """만료된 초대코드 정리 (주기 작업 및 POST /family/cleanup)
+
+    1. 만료된 미사용 코드를 batch_size건씩 사용 처리
+    2. retention_days가 지난 만료 코드를 batch_size건씩 삭제 (0이면 생략, POST /family/cleanup은 항상 0)
+    배치마다 커밋하므로 테이블이 커도 긴 잠금을 잡지 않으며, 한 번에 max_batches까지만 처리합니다.
+    """
+    batch_size = batch_size or _config.INVITATION_SWEEP_BATCH_SIZE
+    max_batches = max_batches or _config.INVITATION_SWEEP_MAX_BATCHES
+    retention_days = _config.INVITATION_RETENTION_DAYS if retention_days is None else retention_days
+
+    def expire_batch():
+        now = datetime.utcnow()
+        expired = and_(Invitation.expires_at < now, Invitation.is_used == False)
+        return update(Invitation).where(
+            Invitation.id.in_(_sweep_batch_ids(expired, batch_size))
+        ).values(is_used=True, used_at=now).execution_options(synchronize_session=False)
+
+    expired_count, expire_batches, expire_backlog = await _run_batches(db, expire_batch, max_batches, batch_size)
+
+    deleted_count, delete_batches, delete_backlog = 0, 0, False
+    if retention_days > 0:
+        def delete_batch():
+            cutoff = datetime.utcnow() - timedelta(days=retention_days)
+            return delete(Invitation).where(
+                Invitation.id.in_(_sweep_batch_ids(Invitation.expires_at < cutoff, batch_size))
+            ).execution_options(synchronize_session=False)
+
+        deleted_count, delete_batches, delete_backlog = await _run_batches(db, delete_batch, max_batches, batch_size)
+
+    if expired_count or deleted_count:
+        logger.info(f"만료 초대코드 정리: 사용 처리 {expired_count}건, 삭제 {deleted_count}건")
+    return {
+        "expired": expired_count,
+        "deleted": deleted_count,
+        "batches": expire_batches + delete_batches,
+        "backlog": expire_backlog or delete_backlog  # True면 처리할 행이 남아 다음 실행에서 이어서 처리
+    }
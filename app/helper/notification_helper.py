@@ -0,0 +1,186 @@
+import asyncio
+import logging
+import httpx
+from datetime import datetime, timedelta
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config.config import get_config
+from app.models.notification_outbox import NotificationOutbox
+from app.utils.circuit_breaker import CircuitOpenError
+from app.utils.notification_client import notification_client
+
+logger = logging.getLogger(__name__)
+
+_config = get_config()
+
+INVITE_ENDPOINT = "/api/v1/notifications/invite"
+CONNECT_ENDPOINT = "/api/v1/notifications/connect"
+BATCH_SUFFIX = "/batch"  # 묶음 발송 엔드포인트: POST {endpoint}/batch
+BATCH_UNSUPPORTED_STATUS = (404, 405)
+
+# 발송 중인 알림을 다른 디스패처가 다시 가져가지 않도록 미뤄두는 시간 (발송 제한 시간보다 길게)
+DISPATCH_LEASE = timedelta(seconds=_config.NOTIFICATION_TIMEOUT_SECONDS * _config.NOTIFICATION_SEND_RETRIES + 30)
+
+def enqueue_notification(db: AsyncSession, endpoint: str, payload: dict) -> NotificationOutbox:
+    """알림을 outbox에 추가 (커밋은 호출자의 트랜잭션에서 함께 수행)"""
+    notification = NotificationOutbox(endpoint=endpoint, payload=payload, available_at=datetime.utcnow())
+    db.add(notification)
+    return notification
+
+def _retry_delay(attempts: int) -> timedelta:
+    return timedelta(seconds=min(2 ** attempts, _config.NOTIFICATION_BACKOFF_MAX_SECONDS))
+
+def _pending_condition(now: datetime):
+    return (
+        NotificationOutbox.sent_at.is_(None),
+        NotificationOutbox.failed_at.is_(None),
+        NotificationOutbox.available_at <= now
+    )
+
+async def _window_ready(db: AsyncSession, now: datetime) -> bool:
+    """묶음 발송 시점 판단: 대기 알림이 묶음 크기만큼 쌓였거나 가장 오래된 알림이 대기 시간을 넘겼을 때"""
+    window = timedelta(seconds=_config.NOTIFICATION_BATCH_WINDOW_SECONDS)
+    pending = select(NotificationOutbox.available_at).where(*_pending_condition(now)) \
+        .limit(_config.NOTIFICATION_BATCH_MAX_EVENTS).subquery()
+    count, oldest = (await db.execute(select(func.count(), func.min(pending.c.available_at)))).one()
+    return count >= _config.NOTIFICATION_BATCH_MAX_EVENTS or (count > 0 and oldest <= now - window)
+
+async def _claim_pending(db: AsyncSession, limit: int) -> list:
+    """발송 대기 알림을 임대(available_at 연장) 후 커밋, 발송 중에는 행 잠금을 잡지 않음"""
+    now = datetime.utcnow()
+    pending_ids = select(NotificationOutbox.id).where(*_pending_condition(now)) \
+        .order_by(NotificationOutbox.available_at).limit(limit).with_for_update(skip_locked=True).scalar_subquery()
+
+    rows = (await db.execute(
+        update(NotificationOutbox)
+        .where(NotificationOutbox.id.in_(pending_ids))
+        .values(available_at=now + DISPATCH_LEASE)
+        .returning(NotificationOutbox.id, NotificationOutbox.endpoint,
+                   NotificationOutbox.payload, NotificationOutbox.attempts)
+        .execution_options(synchronize_session=False)
+    )).all()
+    await db.commit()
+    return sorted(rows, key=lambda row: row.id)
+
+def _error_message(error) -> str:
+    return error if isinstance(error, str) else f"{type(error).__name__}: {error}"
+
+async def _send_one(row):
+    """단건 발송 후 오류 반환 (성공 시 None)"""
+    try:
+        await notification_client.post(row.endpoint, row.payload)
+        return None
+    except Exception as e:
+        return e
+
+async def _send_batch(endpoint: str, rows: list) -> dict:
+    """같은 엔드포인트의 알림을 한 번에 발송하고 이벤트별 결과 반환 {outbox id: 오류 또는 None}
+
+    notification-service는 이벤트마다 결과를 돌려줍니다:
+        요청 {"events": [{"event_id": 1, ...payload}, ...]}
+        응답 {"results": [{"event_id": 1, "success": true}, {"event_id": 2, "success": false, "error": "..."}]}
+    결과에 없는 이벤트는 실패로 보고 재시도합니다.
+    묶음 엔드포인트가 없으면(404/405) 시도 횟수를 쓰지 않고 단건 엔드포인트로 나눠 발송합니다.
+    """
+    events = [{"event_id": row.id, **row.payload} for row in rows]
+    try:
+        response = await notification_client.post(endpoint + BATCH_SUFFIX, {"events": events})
+        results = {
+            result.get("event_id"): None if result.get("success") else (result.get("error") or "rejected")
+            for result in response.json().get("results", [])
+        }
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code not in BATCH_UNSUPPORTED_STATUS:
+            return {row.id: e for row in rows}
+        logger.warning(f"묶음 발송 미지원 ({e.response.status_code}): {endpoint}{BATCH_SUFFIX}, 단건 발송으로 전환 "
+                       f"(NOTIFICATION_BATCH_MAX_EVENTS=1로 설정하세요)")
+        errors = await asyncio.gather(*(_send_one(row) for row in rows))
+        return {row.id: error for row, error in zip(rows, errors)}
+    except Exception as e:
+        return {row.id: e for row in rows}
+    return {row.id: results.get(row.id, "응답에 결과 없음") for row in rows}
+
+async def _send_all(rows: list) -> list:
+    """엔드포인트별로 묶어 최대 NOTIFICATION_BATCH_MAX_EVENTS건씩 동시 발송 (1이면 단건 발송)"""
+    max_events = _config.NOTIFICATION_BATCH_MAX_EVENTS
+    if max_events <= 1:
+        return list(await asyncio.gather(*(_send_one(row) for row in rows)))
+
+    by_endpoint = {}
+    for row in rows:
+        by_endpoint.setdefault(row.endpoint, []).append(row)
+    chunks = [
+        (endpoint, grouped[i:i + max_events])
+        for endpoint, grouped in by_endpoint.items()
+        for i in range(0, len(grouped), max_events)
+    ]
+    errors = {}
+    for chunk_errors in await asyncio.gather(*(_send_batch(endpoint, chunk) for endpoint, chunk in chunks)):
+        errors.update(chunk_errors)
+    return [errors[row.id] for row in rows]
+
+async def _bulk_update(db: AsyncSession, ids: list, **values):
+    if ids:
+        await db.execute(
+            update(NotificationOutbox).where(NotificationOutbox.id.in_(ids))
+            .values(**values).execution_options(synchronize_session=False)
+        )
+
+async def _record_results(db: AsyncSession, rows: list, errors: list) -> tuple:
+    now = datetime.utcnow()
+    sent_ids = [row.id for row, error in zip(rows, errors) if error is None]
+    await _bulk_update(db, sent_ids, sent_at=now)
+    # 서킷이 열려 보내지 못한 알림은 시도 횟수를 늘리지 않고 임대만 해제 (회로가 닫히면 바로 발송)
+    deferred_ids = [row.id for row, error in zip(rows, errors) if isinstance(error, CircuitOpenError)]
+    await _bulk_update(db, deferred_ids, available_at=now)
+
+    gave_up = 0
+    for row, error in zip(rows, errors):
+        if error is None or isinstance(error, CircuitOpenError):
+            continue
+        error = _error_message(error)
+        attempts = row.attempts + 1
+        values = {"attempts": attempts, "last_error": error[:500]}
+        if attempts >= _config.NOTIFICATION_MAX_ATTEMPTS:
+            values["failed_at"] = now
+            gave_up += 1
+            logger.error(f"알림 발송 포기: {row.endpoint} (id={row.id}, {attempts}회 실패) - {error}")
+        else:
+            values["available_at"] = now + _retry_delay(attempts)
+            logger.warning(f"알림 발송 실패, 재시도 예정: {row.endpoint} (id={row.id}, {attempts}회) - {error}")
+        await db.execute(
+            update(NotificationOutbox).where(NotificationOutbox.id == row.id)
+            .values(**values).execution_options(synchronize_session=False)
+        )
+    await db.commit()
+    return len(sent_ids), len(deferred_ids), gave_up
+
+async def dispatch_pending_notifications(db: AsyncSession) -> dict:
+    """outbox의 발송 대기 알림을 notification-service로 발송 (주기 작업)
+
+    대기 알림이 NOTIFICATION_BATCH_MAX_EVENTS건 쌓이거나 가장 오래된 알림이
+    NOTIFICATION_BATCH_WINDOW_SECONDS를 넘기면 엔드포인트별로 묶어 발송하고, 이벤트별 결과로 완료/재시도를 기록합니다.
+    실패한 알림은 지수 백오프 후 다시 발송하고, NOTIFICATION_MAX_ATTEMPTS회 실패하면 포기합니다.
+    notification-service 서킷이 열려 있으면 알림을 가져오지 않고 건너뜁니다 (알림은 outbox에 그대로 대기).
+    """
+    result = {"claimed": 0, "sent": 0, "failed": 0, "deferred": 0, "gave_up": 0}
+    if not notification_client.breaker.allow_request():
+        return {**result, "circuit": notification_client.breaker.state}
+    if not await _window_ready(db, datetime.utcnow()):
+        return result
+
+    rows = await _claim_pending(db, _config.NOTIFICATION_DISPATCH_BATCH_SIZE)
+    if not rows:
+        return result
+
+    sent, deferred, gave_up = await _record_results(db, rows, await _send_all(rows))
+    return {"claimed": len(rows), "sent": sent, "failed": len(rows) - sent - deferred,
+            "deferred": deferred, "gave_up": gave_up}
+
+async def purge_sent_notifications(db: AsyncSession) -> dict:
+    """발송 완료 후 보관 기간이 지난 알림 삭제"""
+    result = await db.execute(
+        delete(NotificationOutbox).where(NotificationOutbox.sent_at < datetime.utcnow() - timedelta(hours=_config.NOTIFICATION_RETENTION_HOURS))
+    )
+    await db.commit()
+    return {"deleted": result.rowcount}
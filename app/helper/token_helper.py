@@ -0,0 +1,199 @@
+import hashlib
+import secrets
+import uuid
+from datetime import datetime, timedelta
+from sqlalchemy import delete, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config.config import get_config
+from app.models.refresh_token import RefreshToken
+from app.models.revoked_token import RevokedToken
+from app.utils.revocation import revocation_list
+
+_config = get_config()
+REFRESH_TOKEN_EXPIRE_DAYS = _config.REFRESH_TOKEN_EXPIRE_DAYS
+
+# 리프레시 토큰 폐기 사유 (재사용 시 안내 메시지 구분)
+REVOKED_ROTATED = "rotated"  # 회전으로 새 토큰 발급
+REVOKED_LOGOUT = "logout"    # 로그아웃
+REVOKED_REUSE = "reuse"      # 폐기된 토큰 재사용 감지로 묶음 전체 폐기
+
+def hash_refresh_token(token: str) -> str:
+    """리프레시 토큰 원문의 SHA-256 해시 (DB에는 해시만 저장)"""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+def _new_refresh_token(user_id: int, family_id: str) -> tuple:
+    token = secrets.token_urlsafe(32)
+    refresh_token = RefreshToken(
+        user_id=user_id,
+        token_hash=hash_refresh_token(token),
+        family_id=family_id,
+        expires_at=datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+    )
+    return token, refresh_token
+
+async def issue_refresh_token(db: AsyncSession, user_id: int) -> str:
+    """로그인/회원가입 시 새 토큰 묶음(family)의 첫 리프레시 토큰 발급"""
+    token, refresh_token = _new_refresh_token(user_id, uuid.uuid4().hex)
+    db.add(refresh_token)
+    await db.commit()
+    return token
+
+async def rotate_refresh_token(db: AsyncSession, token: str) -> tuple:
+    """리프레시 토큰 회전: 사용한 토큰을 폐기하고 같은 묶음의 새 토큰 발급
+
+    이미 폐기된 토큰이 다시 사용되면 탈취로 간주하여 묶음 전체를 폐기합니다.
+    (로그아웃으로 폐기된 묶음이면 재사용이 아니라 로그아웃된 세션으로 안내)
+    반환값: (user_id, 새 리프레시 토큰)
+    """
+    now = datetime.utcnow()
+    token_hash = hash_refresh_token(token)
+
+    # 조건부 UPDATE로 원자적으로 폐기 (동시 회전 시 한 요청만 성공)
+    used = (await db.execute(
+        update(RefreshToken)
+        .where(
+            RefreshToken.token_hash == token_hash,
+            RefreshToken.revoked_at.is_(None),
+            RefreshToken.expires_at > now
+        )
+        .values(revoked_at=now, revoked_reason=REVOKED_ROTATED)
+        .returning(RefreshToken.id, RefreshToken.user_id, RefreshToken.family_id)
+    )).first()
+
+    if used is None:
+        existing = (await db.execute(
+            select(RefreshToken.family_id, RefreshToken.revoked_at).where(RefreshToken.token_hash == token_hash)
+        )).first()
+        if existing is None:
+            raise ValueError("유효하지 않은 리프레시 토큰입니다.")
+        if existing.revoked_at is not None:
+            if await _is_logged_out(db, existing.family_id):
+                raise ValueError("로그아웃된 세션입니다. 다시 로그인해주세요.")
+            await revoke_token_family(db, existing.family_id, REVOKED_REUSE)
+            raise ValueError("이미 사용된 리프레시 토큰입니다. 다시 로그인해주세요.")
+        raise ValueError("만료된 리프레시 토큰입니다.")
+
+    new_token, refresh_token = _new_refresh_token(used.user_id, used.family_id)
+    db.add(refresh_token)
+    await db.flush()
+    await db.execute(
+        update(RefreshToken).where(RefreshToken.id == used.id).values(replaced_by_id=refresh_token.id)
+    )
+    await db.commit()
+    return used.user_id, new_token
+
+async def _is_logged_out(db: AsyncSession, family_id: str) -> bool:
+    """토큰 묶음이 로그아웃으로 폐기되었는지 여부 (회전된 예전 토큰도 같은 묶음의 로그아웃 기록으로 판단)"""
+    logged_out = (await db.execute(
+        select(RefreshToken.id)
+        .where(RefreshToken.family_id == family_id, RefreshToken.revoked_reason == REVOKED_LOGOUT)
+        .limit(1)
+    )).first()
+    return logged_out is not None
+
+async def revoke_token_family(db: AsyncSession, family_id: str, reason: str) -> int:
+    """토큰 묶음 전체 폐기 (로그아웃, 재사용 감지)"""
+    result = await db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=datetime.utcnow(), revoked_reason=reason)
+    )
+    await db.commit()
+    return result.rowcount
+
+async def revoke_refresh_token(db: AsyncSession, token: str) -> bool:
+    """로그아웃 시 해당 리프레시 토큰이 속한 묶음 폐기"""
+    family_id = (await db.execute(
+        select(RefreshToken.family_id).where(RefreshToken.token_hash == hash_refresh_token(token))
+    )).scalar()
+    if family_id is None:
+        return False
+    await revoke_token_family(db, family_id, REVOKED_LOGOUT)
+    return True
+
+async def purge_expired_refresh_tokens(
+    db: AsyncSession,
+    batch_size: int = None,
+    max_batches: int = None,
+    retention_days: int = None
+) -> dict:
+    """만료된 리프레시 토큰과 보관 기간이 지난 폐기 토큰을 batch_size건씩 삭제 (주기 작업)
+
+    배치마다 커밋하므로 테이블이 커도 긴 잠금을 잡지 않으며, 한 번에 max_batches까지만 처리합니다.
+    회전된 토큰은 다음 토큰보다 먼저 만료/폐기되므로 id 순으로 지우면 replaced_by_id 참조가 먼저 사라집니다.
+    """
+    batch_size = batch_size or _config.REFRESH_TOKEN_PURGE_BATCH_SIZE
+    max_batches = max_batches or _config.REFRESH_TOKEN_PURGE_MAX_BATCHES
+    retention_days = _config.REFRESH_TOKEN_REVOKED_RETENTION_DAYS if retention_days is None else retention_days
+
+    deleted = 0
+    for batch in range(1, max_batches + 1):
+        now = datetime.utcnow()
+        purgeable = or_(
+            RefreshToken.expires_at < now,
+            RefreshToken.revoked_at < now - timedelta(days=retention_days)
+        )
+        # 다른 레플리카의 정리 작업과 같은 행을 기다리지 않도록 잠긴 행은 건너뜀 (SQLite는 FOR UPDATE 무시)
+        batch_ids = (
+            select(RefreshToken.id).where(purgeable).order_by(RefreshToken.id)
+            .limit(batch_size).with_for_update(skip_locked=True).scalar_subquery()
+        )
+        result = await db.execute(
+            delete(RefreshToken).where(RefreshToken.id.in_(batch_ids)).execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        deleted += result.rowcount
+        if result.rowcount < batch_size:
+            return {"deleted": deleted, "batches": batch, "backlog": False}
+    return {"deleted": deleted, "batches": max_batches, "backlog": True}
+
+# 액세스 토큰 폐기 목록
+REVOCATION_SYNC_OVERLAP = timedelta(seconds=5)  # 늦게 커밋된 폐기 항목을 놓치지 않도록 겹쳐서 조회
+
+async def revoke_access_token(db: AsyncSession, payload: dict) -> bool:
+    """액세스 토큰을 폐기 목록에 등록 (DB 기록 후 현재 프로세스 메모리에 즉시 반영)"""
+    jti = payload.get("jti")
+    exp = payload.get("exp")
+    if not jti or exp is None:
+        return False
+
+    db.add(RevokedToken(
+        jti=jti,
+        user_id=int(payload["sub"]) if payload.get("sub") else None,
+        expires_at=datetime.utcfromtimestamp(exp),
+        revoked_at=datetime.utcnow()
+    ))
+    try:
+        await db.commit()
+    except IntegrityError:
+        # 다른 레플리카에서 이미 폐기됨 (아직 동기화 전)
+        await db.rollback()
+    revocation_list.add(jti, exp)
+    return True
+
+async def sync_revocation_list(db: AsyncSession) -> dict:
+    """다른 레플리카에서 폐기된 토큰을 증분으로 가져와 메모리 집합에 반영"""
+    now = datetime.utcnow()
+    query = select(RevokedToken.jti, RevokedToken.expires_at, RevokedToken.revoked_at).where(
+        RevokedToken.expires_at > now
+    )
+    if revocation_list.watermark is not None:
+        query = query.where(RevokedToken.revoked_at > revocation_list.watermark - REVOCATION_SYNC_OVERLAP)
+
+    rows = (await db.execute(query)).all()
+    for row in rows:
+        revocation_list.add(row.jti, (row.expires_at - datetime(1970, 1, 1)).total_seconds())
+        if revocation_list.watermark is None or row.revoked_at > revocation_list.watermark:
+            revocation_list.watermark = row.revoked_at
+
+    pruned = revocation_list.prune()
+    return {"fetched": len(rows), "pruned": pruned, "size": len(revocation_list)}
+
+async def purge_expired_revoked_tokens(db: AsyncSession) -> dict:
+    """만료 시각이 지난 폐기 항목 삭제 (만료된 토큰은 서명 검증에서 이미 거절됨)"""
+    result = await db.execute(
+        delete(RevokedToken).where(RevokedToken.expires_at < datetime.utcnow())
+    )
+    await db.commit()
+    return {"deleted": result.rowcount}
@@ -1,3 +1,6 @@
 from .user import User, FamilyRelationship
 from .relationship_type import RelationshipType
 from .invitation import Invitation
+from .refresh_token import RefreshToken
+from .revoked_token import RevokedToken
+from .notification_outbox import NotificationOutbox
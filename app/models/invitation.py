@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, func, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, func, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
 from app.utils.db import Base
 
@@ -21,6 +21,17 @@ class Invitation(Base):
     current_guardians = Column(Integer, default=0, nullable=True)  # 현재 연결된 보호자 수
     is_active = Column(Boolean, default=True, nullable=False)  # 그룹 초대코드 활성화 상태
     
+    __table_args__ = (
+        # 사용자가 생성한 초대코드 목록 (최신순)
+        Index("ix_invitations_inviter_created_at", inviter_id, created_at.desc()),
+        # 만료 초대코드 정리 (미사용 코드만 인덱싱)
+        Index("ix_invitations_unused_expires_at", expires_at,
+              postgresql_where=(is_used == False), sqlite_where=(is_used == False)),
+        # 새 초대코드 생성 시 기존 유효 코드 만료 처리
+        Index("ix_invitations_inviter_unused_expires_at", inviter_id, expires_at,
+              postgresql_where=(is_used == False), sqlite_where=(is_used == False)),
+    )
+    
     # 관계 설정
     inviter = relationship("User", foreign_keys=[inviter_id])
     relationship_type = relationship("RelationshipType")
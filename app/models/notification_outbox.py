@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Index, func
+from app.utils.db import Base
+
+class NotificationOutbox(Base):
+    """notification-service로 보낼 알림 (초대코드/가족 연결과 같은 트랜잭션에 기록, 백그라운드에서 발송)"""
+    __tablename__ = "notification_outbox"
+
+    id = Column(Integer, primary_key=True)
+    endpoint = Column(String, nullable=False)  # 예: /api/v1/notifications/invite
+    payload = Column(JSON, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)  # 발송 실패 횟수
+    available_at = Column(DateTime, nullable=False)  # 다음 발송 시도 가능 시각 (재시도 백오프, 발송 중 임대)
+    created_at = Column(DateTime, server_default=func.now())
+    sent_at = Column(DateTime, nullable=True)  # 발송 완료 시각
+    failed_at = Column(DateTime, nullable=True)  # 최대 시도 횟수 초과로 포기한 시각
+    last_error = Column(String, nullable=True)
+
+    __table_args__ = (
+        # 발송 대기 알림 조회 (미처리 행만 인덱싱)
+        Index("ix_notification_outbox_pending", available_at,
+              postgresql_where=(sent_at.is_(None) & failed_at.is_(None)),
+              sqlite_where=(sent_at.is_(None) & failed_at.is_(None))),
+    )
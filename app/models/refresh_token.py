@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, String, DateTime, func, ForeignKey
+from app.utils.db import Base
+
+class RefreshToken(Base):
+    __tablename__ = "refresh_tokens"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    token_hash = Column(String(64), unique=True, index=True, nullable=False)  # 토큰 원문 대신 SHA-256 해시 저장
+    family_id = Column(String(32), nullable=False, index=True)  # 같은 로그인에서 회전(rotation)된 토큰 묶음
+    expires_at = Column(DateTime, nullable=False)
+    created_at = Column(DateTime, server_default=func.now())
+    revoked_at = Column(DateTime, nullable=True)  # 회전/로그아웃/재사용 감지 시 설정
+    revoked_reason = Column(String(16), nullable=True)  # rotated | logout | reuse
+    replaced_by_id = Column(Integer, ForeignKey("refresh_tokens.id"), nullable=True)  # 회전으로 발급된 다음 토큰
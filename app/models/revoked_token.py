@@ -0,0 +1,10 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from app.utils.db import Base
+
+class RevokedToken(Base):
+    __tablename__ = "revoked_tokens"
+
+    jti = Column(String(32), primary_key=True)  # 폐기된 액세스 토큰 ID
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True)
+    expires_at = Column(DateTime, nullable=False, index=True)  # 토큰 만료 시각 (이후 정리 대상)
+    revoked_at = Column(DateTime, nullable=False, index=True)  # 증분 동기화 기준
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, func, Enum, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, func, Enum, ForeignKey, Boolean, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from app.utils.db import Base
 import enum
@@ -14,6 +14,10 @@ class InvitationStatus(enum.Enum):
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # 사용자 목록 키셋 페이지네이션 (created_at, id)
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     username = Column(String, unique=True, index=True, nullable=False)
@@ -49,9 +53,22 @@ class User(Base):
         back_populates="inviter"
     )
 
+    # 발급된 리프레시 토큰들 (사용자 삭제 시 DB에서 함께 삭제)
+    refresh_tokens = relationship(
+        "RefreshToken",
+        cascade="all, delete-orphan",
+        passive_deletes=True
+    )
+
 
 class FamilyRelationship(Base):
     __tablename__ = "family_relationships"
+    __table_args__ = (
+        # 시니어 기준 조회 + 중복 연결 방지 (유니크 인덱스가 (senior_id, guardian_id) 조회도 담당)
+        UniqueConstraint("senior_id", "guardian_id", name="uq_family_relationships_senior_guardian"),
+        # 보호자 기준 조회
+        Index("ix_family_relationships_guardian_senior", "guardian_id", "senior_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     senior_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -72,6 +72,9 @@ class InvitationCodeStatus(BaseModel):
     expires_at: datetime
     inviter_name: Optional[str] = None
     relationship_type: Optional[str] = None
+    is_group_code: bool = False
+    max_guardians: Optional[int] = None  # 그룹 초대코드 정원
+    current_guardians: Optional[int] = None  # 그룹 초대코드에 연결된 보호자 수
 
 class FamilyMembersResponse(BaseModel):
     """가족 구성원 조회 응답"""
@@ -81,4 +84,5 @@ class FamilyMembersResponse(BaseModel):
 class InvitationCodeListResponse(BaseModel):
     """초대코드 목록 조회 응답"""
     invitations: list[InvitationCodeResponse]
-    total_count: int
+    total_count: Optional[int] = None  # 사용자 전체 초대코드 수 (include_total=false이면 None)
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
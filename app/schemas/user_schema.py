@@ -61,6 +61,30 @@ class User(UserBase):
 
     model_config = ConfigDict(from_attributes=True)
 
+class UserPrincipal(BaseModel):
+    """인증된 사용자 요약 정보 (캐시되므로 불변)"""
+    id: int
+    role: UserRole
+    username: str
+    email: str
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+class TokenBatchVerifyRequest(BaseModel):
+    tokens: List[str]
+
+class TokenVerifyResult(BaseModel):
+    valid: bool
+    user_id: Optional[int] = None
+    email: Optional[str] = None
+    role: Optional[UserRole] = None
+    is_active: Optional[bool] = None
+    username: Optional[str] = None
+    error: Optional[str] = None  # 검증 실패 사유
+
+class TokenBatchVerifyResponse(BaseModel):
+    results: List[TokenVerifyResult]  # 요청 토큰 순서와 동일
+
 class UserLogin(BaseModel) :
     email : str
     password : str
@@ -70,6 +94,8 @@ class Token(BaseModel) :
     token_type : str = "bearer"
     user_role: str  # 사용자 역할 추가
     username: str # <--- ADDED
+    refresh_token: Optional[str] = None  # 액세스 토큰 만료 시 /auth/refresh에 사용
+    expires_in: Optional[int] = None  # 액세스 토큰 유효 시간(초)
 
 class RegisterResponse(BaseModel):
     message: str = "회원가입이 완료되었습니다."
@@ -77,6 +103,11 @@ class RegisterResponse(BaseModel):
     token_type: str = "bearer"
     user_role: str
     username: str
+    refresh_token: Optional[str] = None
+    expires_in: Optional[int] = None
+
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str
 
 class GuardianInfo(BaseModel):
     id: int
@@ -0,0 +1,134 @@
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+class CircuitOpenError(Exception):
+    """회로가 열려 있어 호출하지 않고 즉시 실패"""
+
+class CircuitBreaker:
+    """외부 서비스 호출용 서킷 브레이커 (closed -> open -> half_open -> closed)
+
+    - closed: 정상 호출, 연속 실패가 failure_threshold회에 도달하면 open
+    - open: 호출하지 않고 CircuitOpenError로 즉시 실패, reset_timeout이 지나면 half_open
+    - half_open: 최대 half_open_max_calls건만 시험 호출, 성공하면 closed, 실패하면 다시 open
+    is_failure로 서비스 장애로 볼 예외만 실패로 집계합니다 (4xx 등 요청 오류는 제외).
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0,
+                 half_open_max_calls: int = 1, is_failure=None):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.is_failure = is_failure or (lambda error: True)
+        self.consecutive_failures = 0
+        self.calls = 0
+        self.failures = 0
+        self.short_circuited = 0
+        self.transitions = {}  # "closed->open" -> 횟수
+        self._state = CLOSED
+        self._opened_at = None
+        self._half_open_calls = 0
+        self._lock = threading.Lock()
+
+    def _transition(self, state: str):
+        key = f"{self._state}->{state}"
+        self.transitions[key] = self.transitions.get(key, 0) + 1
+        log = logger.warning if state == OPEN else logger.info
+        log(f"서킷 브레이커 상태 변경: {self.name} {key} (연속 실패 {self.consecutive_failures}회)")
+        self._state = state
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+        self._half_open_calls = 0
+
+    def _refresh(self):
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._transition(HALF_OPEN)
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._refresh()
+            return self._state
+
+    def allow_request(self) -> bool:
+        """호출 가능 여부만 확인 (호출 슬롯을 차지하지 않음)"""
+        with self._lock:
+            self._refresh()
+            return self._state == CLOSED or (
+                self._state == HALF_OPEN and self._half_open_calls < self.half_open_max_calls
+            )
+
+    def reject_if_open(self):
+        """회로가 열려 있으면 즉시 CircuitOpenError (재시도 루프 등 호출 준비 전에 빠르게 거절)"""
+        if not self.allow_request():
+            with self._lock:
+                self.short_circuited += 1
+            raise CircuitOpenError(f"{self.name} 서킷이 열려 있습니다.")
+
+    def _acquire(self):
+        with self._lock:
+            self._refresh()
+            if self._state == HALF_OPEN and self._half_open_calls < self.half_open_max_calls:
+                self._half_open_calls += 1
+            elif self._state != CLOSED:
+                self.short_circuited += 1
+                raise CircuitOpenError(f"{self.name} 서킷이 열려 있습니다.")
+            self.calls += 1
+
+    def _record_success(self):
+        with self._lock:
+            self.consecutive_failures = 0
+            if self._state == HALF_OPEN:
+                self._transition(CLOSED)
+
+    def _record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self.consecutive_failures += 1
+            if self._state == HALF_OPEN or (
+                self._state == CLOSED and self.consecutive_failures >= self.failure_threshold
+            ):
+                self._transition(OPEN)
+
+    def _release(self):
+        # 취소 등으로 결과 없이 끝난 시험 호출의 슬롯 반환
+        with self._lock:
+            if self._state == HALF_OPEN and self._half_open_calls > 0:
+                self._half_open_calls -= 1
+
+    async def call(self, func, *args, **kwargs):
+        """func(*args, **kwargs)를 회로 상태에 따라 실행, 열려 있으면 CircuitOpenError"""
+        self._acquire()
+        try:
+            result = await func(*args, **kwargs)
+        except Exception as e:
+            if self.is_failure(e):
+                self._record_failure()
+            else:
+                self._record_success()
+            raise
+        except BaseException:
+            self._release()
+            raise
+        self._record_success()
+        return result
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._refresh()
+            return {
+                "state": self._state,
+                "consecutive_failures": self.consecutive_failures,
+                "calls": self.calls,
+                "failures": self.failures,
+                "short_circuited": self.short_circuited,
+                "transitions": dict(self.transitions),
+                "open_for_seconds": round(time.monotonic() - self._opened_at, 3) if self._state == OPEN else None,
+            }
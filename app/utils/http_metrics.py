@@ -0,0 +1,57 @@
+import time
+from app.utils.metrics import registry
+
+UNMATCHED_ROUTE = "<unmatched>"  # 라우트가 없는 경로(404 등)는 하나로 묶어 라벨 수 제한
+
+http_requests_total = registry.counter(
+    "http_requests_total", "처리한 HTTP 요청 수", ("method", "route", "status")
+)
+http_requests_in_progress = registry.gauge(
+    "http_requests_in_progress", "처리 중인 HTTP 요청 수", ("method",)
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간 (초)", ("method", "route", "status")
+)
+
+def route_template(scope) -> str:
+    """요청이 매칭된 라우트의 경로 템플릿 (/users/{user_id}), 실제 경로 값은 라벨에 넣지 않음"""
+    route = scope.get("route")  # FastAPI APIRoute가 설정
+    if route is not None:
+        return route.path_format
+    endpoint = scope.get("endpoint")  # Starlette Route (/docs 등)
+    app = scope.get("app")
+    if endpoint is not None and app is not None:
+        for candidate in app.router.routes:
+            if getattr(candidate, "endpoint", None) is endpoint:
+                return candidate.path_format
+    return UNMATCHED_ROUTE
+
+class MetricsMiddleware:
+    """요청 수, 처리 중 요청 수, 처리 시간 히스토그램 기록 (순수 ASGI 미들웨어, 응답 본문을 감싸지 않음)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500  # 응답 시작 전 예외
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        http_requests_in_progress.inc((method,))
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            labels = (method, route_template(scope), str(status))
+            http_request_duration_seconds.observe(time.perf_counter() - started, labels)
+            http_requests_total.inc(labels)
+            http_requests_in_progress.dec((method,))
@@ -0,0 +1,55 @@
+import os
+from jwt.algorithms import OKPAlgorithm, RSAAlgorithm
+
+# 비대칭 서명 알고리즘 -> 공개키 JWK 변환기
+ASYMMETRIC_ALGORITHMS = {
+    "RS256": RSAAlgorithm,
+    "EdDSA": OKPAlgorithm,
+}
+
+class KeyRing:
+    """JWT 서명 키 묶음 (kid -> 개인키)
+
+    활성 키(active_kid)로 서명하고, 나머지 키는 검증/JWKS 공개용으로만 유지합니다.
+    키 교체 시 새 키를 추가해 활성화한 뒤, 이전 키는 발급된 토큰이 모두 만료된 후 제거합니다.
+    """
+
+    def __init__(self, algorithm: str, private_keys: dict, active_kid: str):
+        if algorithm not in ASYMMETRIC_ALGORITHMS:
+            raise ValueError(f"지원하지 않는 JWT 서명 알고리즘입니다: {algorithm}")
+        if active_kid not in private_keys:
+            raise ValueError(f"활성 서명 키를 찾을 수 없습니다: {active_kid}")
+        self.algorithm = algorithm
+        self.active_kid = active_kid
+        self._private_keys = private_keys
+        self._public_keys = {kid: key.public_key() for kid, key in private_keys.items()}
+
+    @classmethod
+    def from_directory(cls, algorithm: str, keys_dir: str, active_kid: str):
+        """<kid>.pem 형식의 PEM 개인키 파일들을 읽어 키 묶음 생성"""
+        from cryptography.hazmat.primitives.serialization import load_pem_private_key
+
+        private_keys = {}
+        for filename in sorted(os.listdir(keys_dir)):
+            if filename.endswith(".pem"):
+                with open(os.path.join(keys_dir, filename), "rb") as f:
+                    private_keys[filename[:-4]] = load_pem_private_key(f.read(), password=None)
+        return cls(algorithm, private_keys, active_kid)
+
+    @property
+    def signing_key(self):
+        return self._private_keys[self.active_kid]
+
+    def verification_key(self, kid: str):
+        """토큰 헤더의 kid에 해당하는 공개키 (없으면 None)"""
+        return self._public_keys.get(kid)
+
+    def jwks(self) -> dict:
+        """GET /.well-known/jwks.json 응답 본문"""
+        to_jwk = ASYMMETRIC_ALGORITHMS[self.algorithm].to_jwk
+        keys = []
+        for kid, public_key in self._public_keys.items():
+            jwk = to_jwk(public_key, as_dict=True)
+            jwk.update({"kid": kid, "alg": self.algorithm, "use": "sig"})
+            keys.append(jwk)
+        return {"keys": keys}
@@ -0,0 +1,131 @@
+import bisect
+
+# Prometheus 텍스트 포맷(0.0.4) 지표 (외부 의존성 없이 필요한 만큼만 구현)
+# 요청 경로(핫 패스)에서는 이벤트 루프 스레드에서만 갱신하므로 락 없이 미리 만든 버킷 배열의 값만 증가시키고,
+# 누적 합산/문자열 변환은 /metrics 조회 시에만 수행합니다.
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: tuple, values: tuple, extra: str = None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _format_value(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name: str, help: str, labelnames: tuple = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._series = {}  # 라벨 값 튜플 -> 값
+
+    def header(self) -> list:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, labels: tuple = (), amount: float = 1):
+        self._series[labels] = self._series.get(labels, 0) + amount
+
+    def render(self) -> list:
+        lines = self.header()
+        for labels, value in list(self._series.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, labels: tuple = (), amount: float = 1):
+        self.inc(labels, -amount)
+
+class _HistogramSeries:
+    __slots__ = ("counts", "sum")
+
+    def __init__(self, size: int):
+        self.counts = [0] * size  # 버킷별 개수 (누적 아님, 마지막은 +Inf)
+        self.sum = 0.0
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: tuple = (), buckets: tuple = DEFAULT_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, labels: tuple = ()):
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = _HistogramSeries(len(self.buckets) + 1)
+        # le 버킷은 경계값 포함 (value <= le)
+        series.counts[bisect.bisect_left(self.buckets, value)] += 1
+        series.sum += value
+
+    def render(self) -> list:
+        lines = self.header()
+        bounds = self.buckets + (float("inf"),)
+        for labels, series in list(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(bounds, list(series.counts)):
+                cumulative += count
+                le = f'le="{_format_value(float(bound))}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(series.sum)}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+class MetricsRegistry:
+    """프로세스 공용 지표 모음"""
+
+    def __init__(self):
+        self._metrics = []
+
+    def counter(self, name: str, help: str, labelnames: tuple = ()) -> Counter:
+        return self._add(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: tuple = ()) -> Gauge:
+        return self._add(Gauge(name, help, labelnames))
+
+    def histogram(self, name: str, help: str, labelnames: tuple = (), buckets: tuple = DEFAULT_BUCKETS) -> Histogram:
+        return self._add(Histogram(name, help, labelnames, buckets))
+
+    def _add(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self, collectors: tuple = ()) -> str:
+        """텍스트 포맷으로 변환
+
+        collectors: 조회 시점에 다른 상태(커넥션 풀, 캐시, 주기 작업 등)를 읽어
+        (이름, 종류, 설명, [(라벨 dict, 값), ...]) 튜플 목록을 반환하는 함수들
+        """
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in collectors:
+            for name, kind, help, samples in collector():
+                lines.append(f"# HELP {name} {help}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    if value is None:
+                        continue
+                    lines.append(f"{name}{_format_labels(tuple(labels), tuple(labels.values()))} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+registry = MetricsRegistry()
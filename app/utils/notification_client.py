@@ -0,0 +1,83 @@
+import httpx
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_exponential
+from app.config.config import get_config
+from app.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+def _is_retryable(error: BaseException) -> bool:
+    # 연결 오류/타임아웃과 5xx만 즉시 재시도 (4xx는 다시 보내도 같은 결과)
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return isinstance(error, httpx.TransportError)
+
+class NotificationClient:
+    """notification-service 호출용 프로세스 공용 HTTP 클라이언트
+
+    create_app lifespan에서 시작/종료하며, 커넥션 풀을 재사용해 요청마다 TCP/TLS 연결을 새로 맺지 않습니다.
+    각 HTTP 호출은 서킷 브레이커를 거치므로, 서비스 장애 중에는 타임아웃을 기다리지 않고 CircuitOpenError로 즉시 실패합니다.
+    """
+
+    def __init__(self, base_url: str, timeout: float, max_connections: int, retries: int, breaker: CircuitBreaker):
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.retries = retries
+        self.breaker = breaker
+        self._client = None
+
+    def start(self):
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.max_connections,
+                                    max_keepalive_connections=self.max_connections)
+            )
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def post(self, endpoint: str, payload) -> httpx.Response:
+        """알림 발송 (일시적 오류는 지수 백오프로 재시도, 최종 실패 시 예외 발생)"""
+        self.start()
+        self.breaker.reject_if_open()
+        last_error = None
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(self.retries),
+            wait=wait_exponential(multiplier=0.1, max=2),
+            retry=retry_if_exception(_is_retryable),
+            reraise=True
+        ):
+            with attempt:
+                try:
+                    response = await self.breaker.call(self._post, endpoint, payload)
+                except CircuitOpenError:
+                    # 재시도 중 회로가 열린 경우 실제 실패 원인을 전달 (발송 실패 횟수에 반영)
+                    if last_error is not None:
+                        raise last_error
+                    raise
+                except Exception as e:
+                    last_error = e
+                    raise
+        return response
+
+    async def _post(self, endpoint: str, payload) -> httpx.Response:
+        response = await self._client.post(endpoint, json=payload)
+        response.raise_for_status()
+        return response
+
+_config = get_config()
+notification_client = NotificationClient(
+    base_url=_config.NOTIFICATION_SERVICE_URL,
+    timeout=_config.NOTIFICATION_TIMEOUT_SECONDS,
+    max_connections=_config.NOTIFICATION_MAX_CONNECTIONS,
+    retries=_config.NOTIFICATION_SEND_RETRIES,
+    breaker=CircuitBreaker(
+        "notification-service",
+        failure_threshold=_config.NOTIFICATION_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout=_config.NOTIFICATION_BREAKER_RESET_SECONDS,
+        half_open_max_calls=_config.NOTIFICATION_BREAKER_HALF_OPEN_CALLS,
+        is_failure=_is_retryable
+    )
+)
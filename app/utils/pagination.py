@@ -0,0 +1,60 @@
+import base64
+import json
+from datetime import datetime
+from sqlalchemy import literal, tuple_
+from sqlalchemy.dialects import sqlite
+
+# (created_at, id) 기준 키셋(커서) 페이지네이션
+# OFFSET은 건너뛴 행을 모두 읽어야 하므로 깊은 페이지일수록 느려지고, 조회 중 행이 추가되면 중복/누락이 생깁니다.
+# 커서는 마지막 행의 (created_at, id)를 담은 불투명 토큰으로, 다음 페이지는 인덱스에서 바로 이어서 읽습니다.
+
+MAX_PAGE_SIZE = 1000  # 목록 API limit 상한
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    raw = json.dumps([created_at.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> tuple:
+    """커서 토큰 -> (created_at, id), 형식이 잘못되면 ValueError"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (TypeError, ValueError, UnicodeError) as e:
+        raise ValueError("유효하지 않은 커서입니다.") from e
+
+def _created_at_literal(created_at: datetime, column):
+    # SQLite의 server_default(CURRENT_TIMESTAMP)는 초 단위 문자열('YYYY-MM-DD HH:MM:SS')로 저장되고
+    # 문자열로 비교되므로, 마이크로초가 없는 값은 같은 형식으로 바인딩해야 동일 시각 행의 순서가 맞습니다.
+    column_type = column.type
+    if created_at.microsecond == 0:
+        column_type = column_type.with_variant(sqlite.DATETIME(truncate_microseconds=True), "sqlite")
+    return literal(created_at, column_type)
+
+def keyset_query(query, created_at_column, id_column, limit: int, cursor: str = None, skip: int = 0, descending: bool = False):
+    """(created_at, id) 순 정렬 후 커서 다음 행부터 limit + 1건 조회 (다음 페이지 존재 여부 확인용 1건 추가)
+
+    커서가 없으면 기존 호환용 skip(OFFSET)을 적용합니다.
+    """
+    key = tuple_(created_at_column, id_column)
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        after = tuple_(_created_at_literal(created_at, created_at_column), literal(row_id, id_column.type))
+        query = query.where(key < after if descending else key > after)
+    elif skip:
+        query = query.offset(skip)
+
+    if descending:
+        query = query.order_by(created_at_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(created_at_column, id_column)
+    return query.limit(limit + 1)
+
+def split_page(rows: list, limit: int) -> tuple:
+    """keyset_query 결과 -> (현재 페이지 행, 다음 페이지 커서 또는 None)"""
+    if limit <= 0:
+        return [], None
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1].created_at, rows[-1].id)
@@ -0,0 +1,66 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from fastapi import HTTPException, status
+from app.config.config import get_config
+from app.utils import security
+
+logger = logging.getLogger(__name__)
+
+class HashingExecutor:
+    """비밀번호 해시/검증 전용 프로세스 풀
+
+    워커 수 + max_pending 을 넘는 요청은 대기열에 쌓지 않고 즉시 503으로 거절하여,
+    로그인 폭주 시에도 이벤트 루프와 다른 API가 영향을 받지 않도록 합니다.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.rejected = 0
+        self._slots = threading.BoundedSemaphore(max_workers + max_pending)
+        self._executor = None
+
+    def start(self):
+        """워커 프로세스를 미리 띄워 첫 요청의 지연을 없앰"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            for _ in range(self.max_workers):
+                self._executor.submit(int)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def _run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            self.rejected += 1
+            logger.warning("비밀번호 해시 작업 대기열 포화: 요청 거절")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="요청이 많아 잠시 후 다시 시도해주세요.",
+                headers={"Retry-After": "1"}
+            )
+        try:
+            self.start()
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self._slots.release()
+
+    async def hash_password(self, password: str) -> str:
+        return await self._run(security.hash_password, password)
+
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(security.verify_password, plain_password, hashed_password)
+
+    async def verify_and_update_password(self, plain_password: str, hashed_password: str) -> tuple:
+        """검증과 (필요 시) 재해시를 한 번의 워커 호출로 처리"""
+        return await self._run(security.verify_and_update_password, plain_password, hashed_password)
+
+_config = get_config()
+password_hasher = HashingExecutor(
+    max_workers=_config.HASH_WORKERS,
+    max_pending=_config.HASH_QUEUE_SIZE
+)
@@ -0,0 +1,90 @@
+import bcrypt
+
+try:
+    from argon2 import PasswordHasher, Type
+    from argon2.exceptions import InvalidHashError, VerificationError
+except ImportError:  # argon2-cffi 미설치 시 bcrypt만 사용
+    PasswordHasher = None
+
+class BcryptScheme:
+    """bcrypt ($2b$<cost>$...) - cost가 해시 문자열에 기록됨"""
+    name = "bcrypt"
+    prefixes = ("$2a$", "$2b$", "$2y$")
+
+    def __init__(self, rounds: int = 12):
+        self.rounds = rounds
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(rounds=config.BCRYPT_ROUNDS)
+
+    def hash(self, password: str) -> str:
+        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(self.rounds)).decode("utf-8")
+
+    def verify(self, password: str, hashed: str) -> bool:
+        try:
+            return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+        except ValueError:
+            return False
+
+    def needs_update(self, hashed: str) -> bool:
+        try:
+            return int(hashed.split("$")[2]) != self.rounds
+        except (IndexError, ValueError):
+            return True
+
+class Argon2idScheme:
+    """argon2id ($argon2id$v=19$m=...,t=...,p=...$...) - 파라미터가 해시 문자열에 기록됨"""
+    name = "argon2id"
+    prefixes = ("$argon2id$",)
+
+    def __init__(self, time_cost: int = 2, memory_cost: int = 19456, parallelism: int = 1):
+        if PasswordHasher is None:
+            raise ValueError("argon2id 해시를 사용하려면 argon2-cffi 패키지가 필요합니다.")
+        self._hasher = PasswordHasher(
+            time_cost=time_cost,
+            memory_cost=memory_cost,
+            parallelism=parallelism,
+            type=Type.ID
+        )
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(
+            time_cost=config.ARGON2_TIME_COST,
+            memory_cost=config.ARGON2_MEMORY_COST,
+            parallelism=config.ARGON2_PARALLELISM
+        )
+
+    def hash(self, password: str) -> str:
+        return self._hasher.hash(password)
+
+    def verify(self, password: str, hashed: str) -> bool:
+        try:
+            return self._hasher.verify(hashed, password)
+        except (VerificationError, InvalidHashError):
+            return False
+
+    def needs_update(self, hashed: str) -> bool:
+        return self._hasher.check_needs_rehash(hashed)
+
+# 등록된 해시 알고리즘 (이름 -> 스킴 클래스)
+SCHEMES = {scheme.name: scheme for scheme in (BcryptScheme, Argon2idScheme)}
+
+def register_scheme(scheme_class):
+    """해시 알고리즘 추가 등록 (name, prefixes, from_config 필요)"""
+    SCHEMES[scheme_class.name] = scheme_class
+    return scheme_class
+
+def identify_scheme(hashed: str):
+    """저장된 해시 문자열의 접두사로 알고리즘 클래스 판별 (알 수 없으면 None)"""
+    for scheme_class in SCHEMES.values():
+        if hashed.startswith(scheme_class.prefixes):
+            return scheme_class
+    return None
+
+def build_scheme(name: str, config):
+    """설정값으로 해시 스킴 인스턴스 생성"""
+    if name not in SCHEMES:
+        raise ValueError(f"지원하지 않는 비밀번호 해시 알고리즘입니다: {name}")
+    return SCHEMES[name].from_config(config)
@@ -0,0 +1,69 @@
+import threading
+import time
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+
+class PoolMetrics:
+    """커넥션 풀 checkout 횟수 및 대기 시간 집계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record_checkout(self, wait_seconds: float):
+        with self._lock:
+            self.checkouts += 1
+            self.wait_seconds_total += wait_seconds
+            if wait_seconds > self.wait_seconds_max:
+                self.wait_seconds_max = wait_seconds
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+                "wait_seconds_avg": round(self.wait_seconds_total / self.checkouts, 6) if self.checkouts else 0.0,
+            }
+
+def instrumented_pool_class(base, metrics: PoolMetrics):
+    """checkout 대기 시간을 기록하는 풀 클래스 생성 (engine.dispose() 후 재생성된 풀도 같은 metrics 사용)"""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = base._do_get(self)
+        except exc.TimeoutError:
+            metrics.record_timeout()
+            raise
+        metrics.record_checkout(time.perf_counter() - start)
+        return conn
+
+    return type(f"Instrumented{base.__name__}", (base,), {"_do_get": _do_get, "metrics": metrics})
+
+def pool_status(engine) -> dict:
+    """엔진의 현재 풀 상태와 누적 지표 반환"""
+    pool = engine.pool
+    status = {"pool_class": type(pool).__name__}
+    if isinstance(pool, (QueuePool, AsyncAdaptedQueuePool)):
+        status.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "timeout": pool.timeout(),
+        })
+    elif isinstance(pool, NullPool):
+        status["note"] = "NullPool: 요청마다 새 커넥션 (외부 풀러 사용)"
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        status.update(metrics.snapshot())
+    return status
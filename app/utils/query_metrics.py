@@ -0,0 +1,159 @@
+import contextvars
+import heapq
+import logging
+import re
+import time
+from functools import lru_cache
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.config.config import get_config
+from app.utils.http_metrics import route_template
+from app.utils.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+_config = get_config()
+
+# 요청별 SQL 집계 (QueryStatsMiddleware가 요청마다 새 QueryStats를 설정)
+# 값은 가변 객체이므로 AsyncSession의 greenlet, 동기 엔드포인트의 스레드풀로 컨텍스트가 복사되어도 같은 객체를 갱신합니다.
+current_query_stats = contextvars.ContextVar("current_query_stats", default=None)
+
+db_statements_per_request = registry.histogram(
+    "db_statements_per_request", "요청당 실행된 SQL 문 수", ("route",),
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100)
+)
+db_seconds_per_request = registry.histogram(
+    "db_seconds_per_request", "요청당 SQL 실행 시간 합계 (초)", ("route",),
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+)
+db_rows_total = registry.counter("db_rows_total", "SQL 결과 행 수 (SELECT 반환 행 + INSERT/UPDATE/DELETE 영향 행)", ("route",))
+
+class QueryStats:
+    """한 요청에서 실행된 SQL 문 수, 실행 시간 합계, 결과/영향 행 수"""
+
+    __slots__ = ("statements", "seconds", "rows", "slowest")
+
+    def __init__(self):
+        self.statements = 0
+        self.seconds = 0.0
+        self.rows = 0
+        self.slowest = []  # 디버그 모드: (실행 시간, 순번, SQL) 최소 힙, 가장 느린 N개만 유지
+
+    def record(self, seconds: float, rows: int, statement: str):
+        """실행된 SQL 1건 기록 (rows: DML 영향 행 수, SELECT 반환 행은 add_rows로 따로 집계)"""
+        self.statements += 1
+        self.seconds += seconds
+        self.rows += rows
+        if _config.SQL_SLOW_QUERY_LOG:
+            entry = (seconds, self.statements, statement)
+            if len(self.slowest) < _config.SQL_SLOW_QUERY_TOP_N:
+                heapq.heappush(self.slowest, entry)
+            else:
+                heapq.heappushpop(self.slowest, entry)
+
+    def add_rows(self, rows: int):
+        self.rows += rows
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.seconds * 1000:.2f};desc="{self.statements} queries, {self.rows} rows"'
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.$])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<!:):\w+|\?")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+@lru_cache(maxsize=1024)
+def fingerprint(statement: str) -> str:
+    """SQL 정규화: 리터럴/바인드 파라미터는 ?, IN 목록은 (...)로 바꿔 같은 형태의 쿼리를 하나로 묶음"""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _NUMBER.sub("?", normalized)
+    normalized = _IN_LIST.sub("(...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+def _affected_rows(cursor, context) -> int:
+    # INSERT/UPDATE/DELETE만 DB-API rowcount 사용 (SELECT의 rowcount는 드라이버마다 -1 또는 부정확)
+    if context is not None and (context.isinsert or context.isupdate or context.isdelete):
+        return max(cursor.rowcount, 0)
+    return 0
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    seconds = time.perf_counter() - conn.info["query_started_at"].pop()
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.record(seconds, _affected_rows(cursor, context), statement)
+
+def _handle_error(context):
+    # 실행 실패 시 after_cursor_execute가 호출되지 않으므로 시작 시각만 정리
+    started = context.connection.info.get("query_started_at") if context.connection is not None else None
+    if started:
+        started.pop()
+
+def _count_returned_rows(orm_execute_state):
+    """Session으로 실행한 SELECT의 반환 행 수 집계
+
+    결과를 FrozenResult로 고정해 행 수를 센 뒤 같은 행을 담은 Result를 돌려줍니다.
+    (AsyncSession.execute는 어차피 결과를 미리 버퍼링하므로 추가 조회 없음, 스트리밍 실행은 집계하지 않음)
+    """
+    stats = current_query_stats.get()
+    options = orm_execute_state.execution_options
+    if stats is None or not orm_execute_state.is_select or options.get("stream_results") or options.get("yield_per"):
+        return None
+    frozen = orm_execute_state.invoke_statement().freeze()
+    stats.add_rows(len(frozen.data))
+    return frozen()
+
+def install_query_hooks(engine):
+    """엔진에 SQL 실행 시간/영향 행 수 집계 이벤트 등록 (비동기 엔진은 sync_engine 전달)"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+def install_session_hooks(session_class=Session):
+    """Session 클래스에 SELECT 반환 행 수 집계 이벤트 등록 (AsyncSession도 내부 동기 Session으로 실행)"""
+    event.listen(session_class, "do_orm_execute", _count_returned_rows)
+
+def _log_slowest(method: str, route: str, stats: QueryStats):
+    for seconds, order, statement in sorted(stats.slowest, reverse=True):
+        logger.info(f"느린 SQL: {method} {route} #{order} {seconds * 1000:.2f} ms - {fingerprint(statement)}")
+
+class QueryStatsMiddleware:
+    """요청별 SQL 집계를 Server-Timing 헤더와 지표로 기록 (순수 ASGI 미들웨어)
+
+    SQL_SLOW_QUERY_LOG가 켜져 있으면 요청마다 가장 느린 SQL_SLOW_QUERY_TOP_N개 문장을 정규화된 형태로 로그에 남깁니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                # 일반 응답은 엔드포인트 실행이 끝난 뒤 시작되므로 이 시점의 집계가 요청 전체 값
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", stats.server_timing().encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_query_stats.reset(token)
+            route = route_template(scope)
+            db_statements_per_request.observe(stats.statements, (route,))
+            db_seconds_per_request.observe(stats.seconds, (route,))
+            if stats.rows:
+                db_rows_total.inc((route,), stats.rows)
+            if stats.slowest:
+                _log_slowest(scope["method"], route, stats)
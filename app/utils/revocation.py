@@ -0,0 +1,36 @@
+import threading
+import time
+
+class RevocationList:
+    """폐기된 액세스 토큰 jti의 메모리 상주 집합
+
+    DB(revoked_tokens)가 원본이며, 주기 작업이 새로 폐기된 항목만 증분으로 가져옵니다.
+    액세스 토큰은 수명이 짧아 만료된 jti를 제거하면 집합 크기가 작게 유지되므로,
+    "폐기되지 않음" 판정은 DB 조회 없이 O(1) 집합 조회로 끝납니다.
+    """
+
+    def __init__(self):
+        self._revoked = {}  # jti -> 토큰 만료 시각(unix timestamp)
+        self._lock = threading.Lock()
+        self.watermark = None  # 마지막으로 반영한 revoked_at
+
+    def add(self, jti: str, expires_at: float):
+        with self._lock:
+            self._revoked[jti] = expires_at
+
+    def is_revoked(self, jti: str) -> bool:
+        return jti is not None and jti in self._revoked
+
+    def prune(self) -> int:
+        """만료된 토큰 제거 (만료된 토큰은 서명 검증 단계에서 이미 거절됨)"""
+        now = time.time()
+        with self._lock:
+            expired = [jti for jti, exp in self._revoked.items() if exp <= now]
+            for jti in expired:
+                del self._revoked[jti]
+        return len(expired)
+
+    def __len__(self):
+        return len(self._revoked)
+
+revocation_list = RevocationList()
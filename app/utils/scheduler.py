@@ -0,0 +1,57 @@
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+class PeriodicTask:
+    """이벤트 루프에서 주기적으로 실행되는 백그라운드 작업 (create_app lifespan에서 시작/종료)"""
+
+    def __init__(self, name: str, interval: float, func, run_on_startup: bool = False):
+        self.name = name
+        self.interval = interval
+        self.func = func  # 인자 없는 async 함수
+        self.run_on_startup = run_on_startup  # 시작 시 한 번 실행 후 주기 실행
+        self.runs = 0
+        self.failures = 0
+        self.last_duration = None
+        self.last_result = None
+        self._task = None
+
+    async def run_once(self):
+        start = time.perf_counter()
+        try:
+            self.last_result = await self.func()
+        except Exception as e:
+            self.failures += 1
+            logger.error(f"주기 작업 실패: {self.name} - {str(e)}")
+        finally:
+            self.runs += 1
+            self.last_duration = time.perf_counter() - start
+
+    async def _loop(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.run_once()
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop(), name=self.name)
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def status(self) -> dict:
+        return {
+            "interval_seconds": self.interval,
+            "runs": self.runs,
+            "failures": self.failures,
+            "last_duration_seconds": round(self.last_duration, 6) if self.last_duration is not None else None,
+            "last_result": self.last_result,
+        }
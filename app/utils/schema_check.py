@@ -0,0 +1,45 @@
+from sqlalchemy import inspect
+
+# 기존 데이터베이스에는 create_all이 추가하지 않는 스키마 요소 (새 테이블에는 create_all이 함께 생성)
+# (테이블, 인덱스/제약조건/컬럼 이름, 추가하는 마이그레이션 스크립트)
+REQUIRED_INDEXES = (
+    ("family_relationships", "uq_family_relationships_senior_guardian", "migrate_family_relationship_indexes.py"),
+    ("family_relationships", "ix_family_relationships_guardian_senior", "migrate_family_relationship_indexes.py"),
+    ("invitations", "ix_invitations_inviter_created_at", "migrate_invitation_indexes.py"),
+    ("invitations", "ix_invitations_unused_expires_at", "migrate_invitation_indexes.py"),
+    ("invitations", "ix_invitations_inviter_unused_expires_at", "migrate_invitation_indexes.py"),
+    ("users", "ix_users_created_at_id", "migrate_user_indexes.py"),
+)
+REQUIRED_COLUMNS = (
+    ("refresh_tokens", "revoked_reason", "migrate_refresh_tokens.py"),
+)
+
+def missing_schema(conn) -> list:
+    """없는 스키마 요소 목록 [(테이블.이름, 마이그레이션 스크립트)]
+
+    유니크 제약조건은 PostgreSQL에서는 제약조건으로, SQLite 마이그레이션에서는 유니크 인덱스로 추가되므로 둘 다 확인합니다.
+    """
+    inspector = inspect(conn)
+    missing = []
+    for table, name, script in REQUIRED_INDEXES:
+        names = {index["name"] for index in inspector.get_indexes(table)}
+        names.update(constraint["name"] for constraint in inspector.get_unique_constraints(table))
+        if name not in names:
+            missing.append((f"{table}.{name}", script))
+    for table, name, script in REQUIRED_COLUMNS:
+        if name not in {column["name"] for column in inspector.get_columns(table)}:
+            missing.append((f"{table}.{name}", script))
+    return missing
+
+def verify_schema(engine) -> None:
+    """마이그레이션이 적용되지 않은 데이터베이스면 서비스 시작을 중단
+
+    중복 가족 관계 방지, 초대코드 수락 경합 처리 등은 유니크 제약조건에 의존하므로
+    제약조건 없이 조용히 동작하지 않도록 누락된 항목과 실행할 스크립트를 알려주고 실패합니다.
+    """
+    with engine.connect() as conn:
+        missing = missing_schema(conn)
+    if missing:
+        items = ", ".join(name for name, _ in missing)
+        scripts = " && ".join(sorted({f"python {script}" for _, script in missing}))
+        raise RuntimeError(f"데이터베이스 스키마에 누락된 항목이 있습니다: {items}. 마이그레이션을 실행하세요: {scripts}")
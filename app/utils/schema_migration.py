@@ -0,0 +1,62 @@
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateIndex
+
+# 기존 데이터베이스에 모델의 인덱스/제약조건을 추가하는 마이그레이션 스크립트용 유틸
+# PostgreSQL은 운영 중 테이블 잠금을 피하기 위해 CONCURRENTLY로 생성 (AUTOCOMMIT 연결 필요)
+
+def autocommit_connection(engine):
+    return engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+
+def create_index(conn, index) -> None:
+    """모델에 선언된 Index 생성 (이미 있으면 건너뜀, 부분/정렬 인덱스 옵션 포함)"""
+    concurrently = conn.dialect.name == "postgresql"
+    if concurrently:
+        index.dialect_kwargs["postgresql_concurrently"] = True
+    try:
+        conn.execute(CreateIndex(index, if_not_exists=True))
+    finally:
+        if concurrently:
+            del index.dialect_kwargs["postgresql_concurrently"]
+
+def add_unique_constraint(conn, constraint) -> None:
+    """모델에 선언된 UniqueConstraint 추가 (유니크 인덱스를 먼저 만든 뒤 제약조건으로 연결)"""
+    table = constraint.table.name
+    columns = ", ".join(column.name for column in constraint.columns)
+    if conn.dialect.name != "postgresql":
+        conn.execute(text(f"CREATE UNIQUE INDEX IF NOT EXISTS {constraint.name} ON {table} ({columns})"))
+        return
+
+    exists = conn.execute(
+        text("SELECT 1 FROM pg_constraint WHERE conname = :name"), {"name": constraint.name}
+    ).first()
+    if exists:
+        return
+    conn.execute(text(f"CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {constraint.name} ON {table} ({columns})"))
+    conn.execute(text(f"ALTER TABLE {table} ADD CONSTRAINT {constraint.name} UNIQUE USING INDEX {constraint.name}"))
+
+def add_column(conn, column) -> bool:
+    """모델에 선언된 nullable 컬럼 추가 (이미 있으면 건너뜀, 추가했으면 True)"""
+    table = column.table.name
+    if column.name in {c["name"] for c in inspect(conn).get_columns(table)}:
+        return False
+    column_type = column.type.compile(dialect=conn.dialect)
+    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column.name} {column_type}"))
+    return True
+
+def explain(conn, statement) -> list:
+    """쿼리 실행 계획 (행 단위 문자열 목록)
+
+    PostgreSQL은 데이터가 적으면 순차 스캔을 고르므로, 인덱스 사용 가능 여부를 보기 위해
+    enable_seqscan을 끄고 계획을 확인합니다.
+    """
+    sql = str(statement.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}))
+    if conn.dialect.name == "postgresql":
+        conn.execute(text("SET enable_seqscan = off"))
+        try:
+            return [row[0] for row in conn.execute(text(f"EXPLAIN {sql}"))]
+        finally:
+            conn.execute(text("RESET enable_seqscan"))
+    return [row[-1] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+
+def uses_index(plan: list, index_name: str) -> bool:
+    return any(index_name in line for line in plan)
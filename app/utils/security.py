@@ -1,31 +1,125 @@
-import bcrypt
 import jwt
 from datetime import datetime, timedelta
 import os
+import time
+import uuid
 from jwt.exceptions import ExpiredSignatureError, InvalidTokenError, DecodeError
 from fastapi import HTTPException, status
 
+from app.config.config import get_config
+from app.utils import password_schemes
+from app.utils.cache import TTLCache
+from app.utils.jwt_keys import KeyRing
+from app.utils.revocation import revocation_list
+
 SECRET_KEY = os.environ.get("SECRET_KEY")
 ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = int(os.environ.get("ACCESS_TOKEN_EXPIRE_MINUTES", "5256000"))
+ACCESS_TOKEN_EXPIRE_MINUTES = int(os.environ.get("ACCESS_TOKEN_EXPIRE_MINUTES", "15"))  # 만료 후 /auth/refresh로 재발급
+ACCESS_TOKEN_MAX_LIFETIME = ACCESS_TOKEN_EXPIRE_MINUTES * 60 + 60  # 허용하는 exp - iat 최대값(초), 서버 간 시계 오차 1분 허용
+
+_config = get_config()
+_schemes = {}
+
+# 비대칭 서명 키 (HS256이면 None, SECRET_KEY로 서명/검증)
+key_ring = None
+if _config.JWT_ALGORITHM != ALGORITHM :
+    key_ring = KeyRing.from_directory(_config.JWT_ALGORITHM, _config.JWT_KEYS_DIR, _config.JWT_ACTIVE_KID)
+
+# 검증이 끝난 토큰의 claims 캐시 (/auth/verify 반복 호출 시 서명 검증/JSON 파싱 생략)
+token_cache = TTLCache(maxsize=_config.TOKEN_CACHE_MAXSIZE, ttl=0)
+
+def _get_scheme(name : str) :
+    if name not in _schemes :
+        _schemes[name] = password_schemes.build_scheme(name, _config)
+    return _schemes[name]
 
 def hash_password(password : str) -> str :
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    """설정된 목표 알고리즘(PASSWORD_HASH_SCHEME)으로 해시"""
+    return _get_scheme(_config.PASSWORD_HASH_SCHEME).hash(password)
 
 def verify_password(plain_password : str, hashed_password : str) -> bool :
-    return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
+    """저장된 해시에 기록된 알고리즘으로 검증"""
+    scheme_class = password_schemes.identify_scheme(hashed_password)
+    if scheme_class is None :
+        return False
+    return _get_scheme(scheme_class.name).verify(plain_password, hashed_password)
+
+def verify_and_update_password(plain_password : str, hashed_password : str) -> tuple :
+    """검증 후 저장된 알고리즘/파라미터가 목표와 다르면 새 해시도 함께 반환
+
+    반환값: (검증 성공 여부, 재해시 값 또는 None)
+    """
+    if not verify_password(plain_password, hashed_password) :
+        return False, None
+    target = _get_scheme(_config.PASSWORD_HASH_SCHEME)
+    if not hashed_password.startswith(target.prefixes) or target.needs_update(hashed_password) :
+        return True, target.hash(plain_password)
+    return True, None
 
 def create_access_token(data : dict, expires_delta : timedelta = None) :
+    expires_delta = expires_delta or timedelta(minutes = ACCESS_TOKEN_EXPIRE_MINUTES)
+    if expires_delta.total_seconds() > ACCESS_TOKEN_MAX_LIFETIME :
+        raise ValueError(f"액세스 토큰 유효기간은 {ACCESS_TOKEN_EXPIRE_MINUTES}분을 넘을 수 없습니다.")
     to_encode = data.copy()
-    expire = datetime.utcnow() + (expires_delta or timedelta(minutes = ACCESS_TOKEN_EXPIRE_MINUTES))
-    to_encode.update({"exp" : expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm = ALGORITHM)
+    now = datetime.utcnow()
+    to_encode.update({"iat" : now, "exp" : now + expires_delta})
+    to_encode.setdefault("jti", uuid.uuid4().hex)  # 로그아웃 시 폐기 목록 등록용 토큰 ID
+    if key_ring is None :
+        return jwt.encode(to_encode, SECRET_KEY, algorithm = ALGORITHM)
+    encoded_jwt = jwt.encode(
+        to_encode, key_ring.signing_key, algorithm = key_ring.algorithm,
+        headers = {"kid" : key_ring.active_kid}
+    )
     return encoded_jwt
 
+def _decode(token : str) -> dict :
+    """서명 검증 후 claims 반환 (비대칭 서명은 헤더의 kid로 공개키 선택)"""
+    if key_ring is None :
+        return jwt.decode(token, SECRET_KEY, algorithms = [ALGORITHM])
+    kid = jwt.get_unverified_header(token).get("kid")
+    public_key = key_ring.verification_key(kid)
+    if public_key is None :
+        raise InvalidTokenError(f"알 수 없는 서명 키입니다: {kid}")
+    return jwt.decode(token, public_key, algorithms = [key_ring.algorithm])
+
 def decode_access_token(token : str) :
+    """토큰 검증 후 claims 반환 (캐시된 claims는 읽기 전용으로 취급)"""
+    payload = token_cache.get(token)
+    if payload is None :
+        payload = _verify_token(token)
+        _check_revocable(payload)
+        # 캐시 항목은 토큰의 exp 시점에 정확히 만료 (exp 없는 토큰은 캐시하지 않음)
+        exp = payload.get("exp")
+        if exp is not None :
+            token_cache.set(token, payload, ttl = exp - time.time())
+
+    # 폐기 여부는 캐시 적중 시에도 확인 (메모리 집합 조회)
+    if revocation_list.is_revoked(payload.get("jti")) :
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="폐기된 토큰입니다.",
+            headers={"WWW-Authenticate": "Bearer error=\"invalid_token\""}
+        )
+    return payload
+
+def _check_revocable(payload : dict) :
+    """로그아웃으로 폐기할 수 있는 토큰인지 확인
+
+    jti가 없거나 유효기간이 ACCESS_TOKEN_EXPIRE_MINUTES보다 긴 토큰(jti 도입 전 발급된 장기 토큰)은
+    폐기 목록에 등록할 수 없으므로 서명이 유효해도 거절합니다. iat가 없으면 남은 유효기간으로 판단합니다.
+    """
+    exp = payload.get("exp")
+    issued_at = payload.get("iat", time.time())
+    if not payload.get("jti") or exp is None or exp - issued_at > ACCESS_TOKEN_MAX_LIFETIME :
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="더 이상 지원하지 않는 토큰입니다. 다시 로그인해주세요.",
+            headers={"WWW-Authenticate": "Bearer error=\"invalid_token\""}
+        )
+
+def _verify_token(token : str) :
     try : 
-        payload = jwt.decode(token, SECRET_KEY, algorithms = [ALGORITHM])
-        return payload
+        return _decode(token)
     except ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -54,7 +148,7 @@ def decode_access_token(token : str) :
 def is_token_expired(token: str) -> bool:
     """토큰 만료 여부 확인"""
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = _decode(token)
         exp = payload.get("exp")
         if exp is None:
             return True
@@ -0,0 +1,13 @@
+"""벤치마크 스크립트 공용 도구 (benchmarks/ 디렉토리에서 import)"""
+
+from sqlalchemy import event
+
+class StatementCounter:
+    """엔진에서 실행된 SQL 문 수 집계"""
+
+    def __init__(self, target_engine):
+        self.count = 0
+        event.listen(target_engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+가족 구성원 조회 벤치마크 (GET /family/members, GET /users/{senior_id}/guardians)
+가족 구성원 수(1, 10, 100명)별 실행되는 SQL 문 수와 평균 지연시간을 측정합니다.
+SQL 문 수와 조회 결과 검증은 tests/test_family_members.py에서 합니다.
+
+사용 예:
+    python benchmarks/bench_family_members.py --repeat 200
+    DATABASE_URL=postgresql://... python benchmarks/bench_family_members.py
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{Path(__file__).parent / 'bench.db'}")
+
+from app.helper import invitation_helper, user_helper
+from app.models.relationship_type import RelationshipType
+from app.models.user import FamilyRelationship, User, UserRole
+from app.utils.db import AsyncSessionLocal, Base, SessionLocal, async_engine, engine
+from bench_common import StatementCounter
+
+FAMILY_SIZES = (1, 10, 100)
+
+def seed_family(size: int) -> int:
+    """보호자 size명이 연결된 시니어 생성 후 시니어 ID 반환"""
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        relationship_type = db.query(RelationshipType).filter(RelationshipType.name == "BENCH").first()
+        if relationship_type is None:
+            relationship_type = RelationshipType(name="BENCH", display_name_ko="벤치")
+            db.add(relationship_type)
+            db.flush()
+
+        suffix = f"{size}_{time.time_ns()}"
+        senior = User(username=f"bench_senior_{suffix}", email=f"bench_senior_{suffix}@example.com",
+                      hashed_password="x", role=UserRole.senior)
+        guardians = [
+            User(username=f"bench_guardian_{suffix}_{i}", email=f"bench_guardian_{suffix}_{i}@example.com",
+                 hashed_password="x", role=UserRole.guardian)
+            for i in range(size)
+        ]
+        db.add(senior)
+        db.add_all(guardians)
+        db.flush()
+        db.add_all([
+            FamilyRelationship(senior_id=senior.id, guardian_id=guardian.id,
+                               relationship_type_id=relationship_type.id)
+            for guardian in guardians
+        ])
+        db.commit()
+        return senior.id
+    finally:
+        db.close()
+
+async def family_members(db, user_id: int) -> list:
+    return (await invitation_helper.get_user_family_members_async(db, user_id))["guardians"]
+
+async def guardians_for_senior(db, user_id: int) -> list:
+    return await user_helper.get_guardians_for_senior_async(db, user_id)
+
+LOOKUPS = {"members": family_members, "guardians": guardians_for_senior}
+
+async def measure(counter: StatementCounter, lookup, user_id: int, repeat: int) -> dict:
+    async with AsyncSessionLocal() as db:
+        counter.count = 0
+        await lookup(db, user_id)
+        statements = counter.count
+
+        started = time.perf_counter()
+        for _ in range(repeat):
+            await lookup(db, user_id)
+        elapsed = time.perf_counter() - started
+
+    return {"statements": statements, "avg_ms": elapsed / repeat * 1000}
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    counter = StatementCounter(async_engine.sync_engine)
+    for size in FAMILY_SIZES:
+        user_id = seed_family(size)
+        for name, lookup in LOOKUPS.items():
+            result = await measure(counter, lookup, user_id, args.repeat)
+            print(f"{name:>10} 구성원 {size:>4}명: SQL {result['statements']}회, 평균 {result['avg_ms']:7.2f} ms")
+
+    await async_engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
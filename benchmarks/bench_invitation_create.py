@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+초대코드 생성 벤치마크
+기존 유효 초대코드 수(0, 10, 100, 1000개)별 새 코드 생성 시 실행되는 SQL 문 수와 평균 지연시간을 측정합니다.
+SQL 문 수(4회)와 기존 코드 만료/비활성화 검증은 tests/test_invitation_create.py에서 합니다.
+
+사용 예:
+    python benchmarks/bench_invitation_create.py --repeat 50
+    DATABASE_URL=postgresql://... python benchmarks/bench_invitation_create.py
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{Path(__file__).parent / 'bench.db'}")
+
+from sqlalchemy import insert
+
+from app.helper import invitation_helper, user_helper
+from app.models.invitation import Invitation
+from app.models.user import User, UserRole
+from app.utils.db import AsyncSessionLocal, Base, SessionLocal, async_engine, engine
+from bench_common import StatementCounter
+
+STALE_COUNTS = (0, 10, 100, 1000)
+
+def seed_senior(stale: int, group: bool) -> int:
+    """유효한 기존 초대코드 stale개를 가진 시니어 생성 후 ID 반환"""
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        suffix = time.time_ns()
+        senior = User(username=f"invite_senior_{suffix}", email=f"invite_senior_{suffix}@example.com",
+                      hashed_password="x", role=UserRole.senior)
+        db.add(senior)
+        db.commit()
+        senior_id = senior.id
+    finally:
+        db.close()
+
+    if stale:
+        with engine.begin() as conn:
+            conn.execute(insert(Invitation), [
+                {
+                    "code": invitation_helper.generate_invitation_code(),
+                    "inviter_id": senior_id,
+                    "is_used": False,
+                    "expires_at": datetime.utcnow() + timedelta(days=1),
+                    "is_group_code": group,
+                    "max_guardians": 10 if group else 1,
+                    "current_guardians": 0,
+                    "is_active": True,
+                }
+                for _ in range(stale)
+            ])
+    return senior_id
+
+async def measure(counter: StatementCounter, stale: int, group: bool, repeat: int) -> dict:
+    create = (invitation_helper.create_group_invitation_code_async if group
+              else invitation_helper.create_invitation_code_async)
+    senior_id = seed_senior(stale, group)
+    async with AsyncSessionLocal() as db:
+        await user_helper.get_user_principal_async(db, senior_id)  # principal 캐시 워밍업
+
+        counter.count = 0
+        await create(db, inviter_id=senior_id)
+        statements = counter.count
+
+        started = time.perf_counter()
+        for _ in range(repeat):
+            await create(db, inviter_id=senior_id)
+        elapsed = time.perf_counter() - started
+
+    return {"statements": statements, "avg_ms": elapsed / repeat * 1000}
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    counter = StatementCounter(async_engine.sync_engine)
+    for group in (False, True):
+        name = "그룹" if group else "개별"
+        for stale in STALE_COUNTS:
+            result = await measure(counter, stale, group, args.repeat)
+            print(f"{name} 초대코드, 기존 코드 {stale:>5}개: SQL {result['statements']}회, 평균 {result['avg_ms']:7.2f} ms")
+
+    await async_engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
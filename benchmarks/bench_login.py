@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+로그인(비밀번호 검증) 처리량 부하 테스트
+해시 전용 프로세스 풀의 워커 수를 늘려가며 초당 검증 횟수가 코어 수에 비례해 늘어나는지 확인합니다.
+
+사용 예:
+    python benchmarks/bench_login.py --rounds 12 --logins 200
+    python benchmarks/bench_login.py --url http://localhost:8000 --email a@b.com --password Passw0rd!
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{Path(__file__).parent / 'bench.db'}")
+
+import httpx
+
+from app.utils.password_hasher import HashingExecutor
+from app.utils.password_schemes import BcryptScheme
+
+async def bench_executor(workers: int, logins: int, hashed: str) -> float:
+    hasher = HashingExecutor(max_workers=workers, max_pending=logins)
+    hasher.start()
+    try:
+        await hasher.verify_password("Passw0rd!", hashed)  # 워밍업
+        started = time.perf_counter()
+        results = await asyncio.gather(*(hasher.verify_password("Passw0rd!", hashed) for _ in range(logins)))
+        elapsed = time.perf_counter() - started
+        assert all(results)
+        return logins / elapsed
+    finally:
+        hasher.shutdown()
+
+async def bench_server(url: str, email: str, password: str, logins: int, concurrency: int):
+    statuses = {}
+    counter = iter(range(logins))
+
+    async def worker(client):
+        for _ in counter:
+            response = await client.post("/auth/login", json={"email": email, "password": password})
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    async with httpx.AsyncClient(base_url=url, timeout=60.0) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    print(f"서버 로그인: {logins / elapsed:.1f} req/s, 상태 코드 분포 {statuses}")
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt cost")
+    parser.add_argument("--logins", type=int, default=100)
+    parser.add_argument("--url", help="실행 중인 서버 주소 (지정 시 /auth/login 부하 테스트)")
+    parser.add_argument("--email")
+    parser.add_argument("--password")
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    if args.url:
+        await bench_server(args.url, args.email, args.password, args.logins, args.concurrency)
+        return
+
+    hashed = BcryptScheme(rounds=args.rounds).hash("Passw0rd!")
+    cores = os.cpu_count() or 1
+    worker_counts = sorted({1, *[2 ** i for i in range(1, cores.bit_length()) if 2 ** i <= cores], cores})
+
+    print(f"bcrypt cost {args.rounds}, 검증 {args.logins}회, CPU 코어 {cores}개")
+    baseline = None
+    for workers in worker_counts:
+        rate = await bench_executor(workers, args.logins, hashed)
+        baseline = baseline or rate
+        print(f"워커 {workers:>3}개: {rate:8.1f} logins/s  (x{rate / baseline:.2f})")
+
+if __name__ == "__main__":
+    asyncio.run(main())
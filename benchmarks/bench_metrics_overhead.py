@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+HTTP 지표 미들웨어 오버헤드 벤치마크
+최소 ASGI 앱을 MetricsMiddleware로 감쌌을 때와 감싸지 않았을 때의 요청당 처리 시간을 비교하고,
+/metrics 텍스트 생성 시간을 측정합니다. (네트워크/프레임워크 비용을 빼고 미들웨어 비용만 측정)
+
+사용 예:
+    python benchmarks/bench_metrics_overhead.py --requests 200000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{Path(__file__).parent / 'bench.db'}")
+
+from app.utils.http_metrics import MetricsMiddleware
+from app.utils.metrics import registry
+
+class _Route:
+    path_format = "/users/{user_id}"
+
+ROUTE = _Route()
+
+async def endpoint_app(scope, receive, send):
+    scope["route"] = ROUTE  # 라우터가 설정하는 값 흉내
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+async def send(message):
+    pass
+
+async def time_requests(app, count: int) -> float:
+    started = time.perf_counter()
+    for i in range(count):
+        await app({"type": "http", "method": "GET", "path": f"/users/{i}"}, receive, send)
+    return (time.perf_counter() - started) / count * 1e6
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200000)
+    args = parser.parse_args()
+
+    bare = await time_requests(endpoint_app, args.requests)
+    wrapped = await time_requests(MetricsMiddleware(endpoint_app), args.requests)
+    print(f"미들웨어 없음: {bare:6.2f} µs/요청")
+    print(f"미들웨어 적용: {wrapped:6.2f} µs/요청 (오버헤드 {wrapped - bare:.2f} µs)")
+
+    started = time.perf_counter()
+    text = registry.render()
+    print(f"/metrics 생성: {(time.perf_counter() - started) * 1000:.2f} ms, {len(text.splitlines())}줄")
+
+if __name__ == "__main__":
+    asyncio.run(main())
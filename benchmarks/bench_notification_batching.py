@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+알림 묶음 발송 벤치마크
+그룹 초대코드를 보호자 여러 명이 수락하는 상황처럼 알림이 몰릴 때, 단건 발송과 묶음 발송의
+notification-service 요청 수(이벤트당 요청 수)를 스텁 서버로 비교합니다 (--reject-rate로 이벤트별 실패 후 재시도 포함).
+정확히 한 번 전달되는지는 tests/test_notification_batching.py에서 검증합니다.
+
+사용 예:
+    python benchmarks/bench_notification_batching.py --events 1000
+    python benchmarks/bench_notification_batching.py --events 1000 --reject-rate 0.1
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{Path(__file__).parent / 'bench.db'}")
+
+import httpx
+from sqlalchemy import delete, func
+
+from app.helper import notification_helper
+from app.models.notification_outbox import NotificationOutbox
+from app.utils.db import AsyncSessionLocal, Base, async_engine, engine
+from app.utils.notification_client import notification_client
+from stub_notification_server import create_stub_app
+
+async def enqueue(count: int):
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(NotificationOutbox))
+        for i in range(count):
+            if i % 2:
+                notification_helper.enqueue_notification(db, notification_helper.CONNECT_ENDPOINT, {
+                    "guardian_id": i, "senior_id": 1, "relationship_type": None
+                })
+            else:
+                notification_helper.enqueue_notification(db, notification_helper.INVITE_ENDPOINT, {
+                    "inviter_id": 1, "invitation_code": f"CODE{i:04d}", "notification_type": "family_invitation"
+                })
+        await db.commit()
+
+async def drain(max_events: int) -> int:
+    """대기 알림이 없어질 때까지 발송 (재시도 백오프는 즉시 만료시킴), 디스패치 실행 횟수 반환"""
+    notification_helper._config.NOTIFICATION_BATCH_MAX_EVENTS = max_events
+    notification_helper._config.NOTIFICATION_BATCH_WINDOW_SECONDS = 0
+    runs = 0
+    async with AsyncSessionLocal() as db:
+        while True:
+            result = await notification_helper.dispatch_pending_notifications(db)
+            runs += 1
+            if result["failed"]:
+                await db.execute(
+                    NotificationOutbox.__table__.update()
+                    .where(NotificationOutbox.sent_at.is_(None))
+                    .values(available_at=func.now())
+                )
+                await db.commit()
+            elif not result["claimed"]:
+                return runs
+
+async def measure(events: int, max_events: int, reject_rate: float) -> dict:
+    stub = create_stub_app(reject_rate if max_events > 1 else 0.0)
+    notification_client._client = httpx.AsyncClient(base_url="http://stub", transport=httpx.ASGITransport(app=stub))
+    await enqueue(events)
+
+    started = time.perf_counter()
+    runs = await drain(max_events)
+    elapsed = time.perf_counter() - started
+    await notification_client.aclose()
+
+    return {
+        "requests": stub.state.stats["requests"],
+        "rejected": stub.state.stats["rejected"],
+        "runs": runs,
+        "elapsed": elapsed,
+    }
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=1000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 10, 50, 100])
+    parser.add_argument("--reject-rate", type=float, default=0.0, help="묶음 발송 시 이벤트별 실패 확률")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    logging.getLogger(notification_helper.__name__).setLevel(logging.CRITICAL)  # 재시도 경고 로그 생략
+    print(f"알림 {args.events}건, 이벤트별 실패 확률 {args.reject_rate}")
+    print(f"{'묶음 크기':>8} {'요청 수':>8} {'이벤트당 요청':>12} {'재시도':>6} {'소요 (s)':>9}")
+    for max_events in args.batch_sizes:
+        result = await measure(args.events, max_events, args.reject_rate)
+        print(f"{max_events:>8} {result['requests']:>8} {result['requests'] / args.events:>12.3f} "
+              f"{result['rejected']:>6} {result['elapsed']:>9.2f}")
+    await async_engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+GET /users/ 페이지네이션 벤치마크
+대용량 users 테이블(기본 100만 행)에서 OFFSET(skip) 방식과 커서(키셋) 방식의
+페이지 조회 지연시간을 깊이별로 비교합니다. 커서 방식은 깊이와 무관하게 일정해야 합니다.
+
+사용 예:
+    python benchmarks/bench_pagination.py --rows 1000000
+    DATABASE_URL=postgresql://... python benchmarks/bench_pagination.py
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{Path(__file__).parent / 'bench_pagination.db'}")
+
+from sqlalchemy import func, insert, select
+
+from app.helper import user_helper
+from app.models.user import User, UserRole
+from app.utils.db import AsyncSessionLocal, Base, async_engine, engine
+from app.utils.pagination import encode_cursor
+
+BATCH_SIZE = 50000
+
+def seed_users(count: int) -> int:
+    """벤치마크용 사용자 대량 생성 (이미 충분하면 건너뜀)"""
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        existing = conn.execute(select(func.count()).select_from(User)).scalar()
+        started = datetime(2024, 1, 1)
+        for offset in range(existing, count, BATCH_SIZE):
+            conn.execute(insert(User), [
+                {
+                    "username": f"page_user_{i}",
+                    "email": f"page_user_{i}@example.com",
+                    "hashed_password": "x",
+                    "role": UserRole.senior,
+                    # 같은 created_at이 여러 행에 걸치도록 (id로 순서 보장 확인)
+                    "created_at": started + timedelta(seconds=i // 3, microseconds=500000),
+                }
+                for i in range(offset, min(offset + BATCH_SIZE, count))
+            ])
+        return max(existing, count)
+
+async def cursor_at(depth: int) -> str:
+    """depth번째 행 바로 앞까지 읽은 상태의 커서"""
+    async with AsyncSessionLocal() as db:
+        row = (await db.execute(
+            select(User.created_at, User.id).order_by(User.created_at, User.id).offset(depth - 1).limit(1)
+        )).first()
+    return encode_cursor(row.created_at, row.id)
+
+async def time_page(repeat: int, limit: int, **kwargs) -> float:
+    async with AsyncSessionLocal() as db:
+        started = time.perf_counter()
+        for _ in range(repeat):
+            users, _ = await user_helper.get_users_async(db, limit=limit, **kwargs)
+            assert len(users) == limit
+        return (time.perf_counter() - started) / repeat * 1000
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = seed_users(args.rows)
+    depths = [d for d in (1, 10000, 100000, 500000, 900000) if d + args.limit <= rows]
+
+    print(f"사용자 {rows}행, 페이지 크기 {args.limit}, 반복 {args.repeat}회")
+    print(f"{'깊이':>10} {'OFFSET (ms)':>12} {'커서 (ms)':>10}")
+    for depth in depths:
+        offset_ms = await time_page(args.repeat, args.limit, skip=depth)
+        cursor_ms = await time_page(args.repeat, args.limit, cursor=await cursor_at(depth))
+        print(f"{depth:>10} {offset_ms:12.2f} {cursor_ms:10.2f}")
+    await async_engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+요청별 SQL 집계(query_metrics) 확인 및 오버헤드 벤치마크
+1. 컨텍스트 전달: AsyncSession(greenlet 내부 실행), 스레드풀의 동기 Session에서 실행된 SQL의
+   문 수와 반환 행 수가 현재 요청의 QueryStats에 집계되는지, 동시에 실행되는 요청끼리 섞이지 않는지 확인합니다.
+2. 오버헤드: 이벤트 훅 등록 전/후 단순 SELECT(1행)의 평균 지연시간을 비교합니다.
+
+사용 예:
+    python benchmarks/bench_query_stats.py --repeat 5000
+    DATABASE_URL=postgresql://... python benchmarks/bench_query_stats.py
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{Path(__file__).parent / 'bench.db'}")
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from app.models.user import User, UserRole
+from app.utils import query_metrics
+from app.utils.db import AsyncSessionLocal, Base, SessionLocal, async_engine, engine
+from app.utils.query_metrics import QueryStats, current_query_stats
+
+async def run_request(statements: int, delay: float = 0.0) -> QueryStats:
+    """요청 하나를 흉내 냄: 미들웨어처럼 QueryStats를 설정하고 비동기/동기 세션으로 SQL 실행"""
+    stats = QueryStats()
+    token = current_query_stats.set(stats)
+    try:
+        async with AsyncSessionLocal() as db:
+            for _ in range(statements):
+                await db.execute(select(User.id).limit(3))
+                await asyncio.sleep(delay)  # 다른 요청과 교차 실행
+
+        def sync_query():
+            db = SessionLocal()
+            try:
+                db.execute(select(User.id).limit(1)).all()
+            finally:
+                db.close()
+
+        await asyncio.to_thread(sync_query)
+    finally:
+        current_query_stats.reset(token)
+    return stats
+
+def seed_users(count: int):
+    """조회 결과 행 수를 확인할 수 있도록 사용자 count명 보장"""
+    db = SessionLocal()
+    try:
+        existing = db.query(User).count()
+        db.add_all([
+            User(username=f"bench_user_{i}", email=f"bench_user_{i}@example.com",
+                 hashed_password="x", role=UserRole.senior)
+            for i in range(existing, count)
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+async def check_propagation() -> bool:
+    results = await asyncio.gather(*(run_request(n, delay=0.001) for n in (1, 2, 5, 10)))
+    ok = True
+    for expected, stats in zip((1, 2, 5, 10), results):
+        # 비동기 SELECT는 3행씩, 동기 SELECT는 1행
+        passed = stats.statements == expected + 1 and stats.rows == expected * 3 + 1 and stats.seconds > 0
+        ok = ok and passed
+        print(f"{'✅' if passed else '❌'} 비동기 {expected}회 + 동기 1회 -> 집계 {stats.statements}회, "
+              f"{stats.seconds * 1000:.2f} ms, {stats.rows}행")
+
+    # 요청 밖(주기 작업 등)에서 실행된 SQL은 집계하지 않음
+    async with AsyncSessionLocal() as db:
+        await db.execute(select(User.id).limit(1))
+    passed = current_query_stats.get() is None
+    print(f"{'✅' if passed else '❌'} 요청 컨텍스트 밖 SQL은 집계 대상 없음")
+    return ok and passed
+
+async def time_selects(repeat: int) -> float:
+    stats = QueryStats()
+    token = current_query_stats.set(stats)
+    try:
+        async with AsyncSessionLocal() as db:
+            started = time.perf_counter()
+            for _ in range(repeat):
+                (await db.execute(select(User.id).limit(1))).all()
+            return (time.perf_counter() - started) / repeat * 1e6
+    finally:
+        current_query_stats.reset(token)
+
+def remove_hooks(target):
+    event.remove(target, "before_cursor_execute", query_metrics._before_cursor_execute)
+    event.remove(target, "after_cursor_execute", query_metrics._after_cursor_execute)
+    event.remove(target, "handle_error", query_metrics._handle_error)
+    event.remove(Session, "do_orm_execute", query_metrics._count_returned_rows)
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5000)
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    seed_users(3)
+    ok = await check_propagation()
+
+    await time_selects(100)  # 워밍업
+    with_hooks = await time_selects(args.repeat)
+    remove_hooks(async_engine.sync_engine)
+    without_hooks = await time_selects(args.repeat)
+    query_metrics.install_query_hooks(async_engine.sync_engine)
+    query_metrics.install_session_hooks()
+    print(f"SELECT: 훅 없음 {without_hooks:.1f} µs, 훅 적용 {with_hooks:.1f} µs "
+          f"(오버헤드 {with_hooks - without_hooks:.1f} µs/문)")
+
+    await async_engine.dispose()
+    if not ok:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+GET /users/{id} 벤치마크
+스레드풀 오프로딩(get_db + run_in_threadpool) 방식과 비동기 세션(get_async_db) 방식의
+처리량(req/s)과 p99 지연시간을 비교합니다.
+
+사용 예:
+    python benchmarks/bench_user_get.py --concurrency 500 --requests 20000
+    DATABASE_URL=postgresql://... python benchmarks/bench_user_get.py
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{Path(__file__).parent / 'bench.db'}")
+
+import httpx
+from fastapi import Depends, FastAPI, HTTPException
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.api import user_router
+from app.helper import user_helper
+from app.models.user import User, UserRole
+from app.utils.db import Base, SessionLocal, async_engine, engine, get_db
+
+def build_app() -> FastAPI:
+    """비동기 라우터(/users)와 기존 스레드풀 방식(/threadpool/users)을 함께 올린 앱"""
+    app = FastAPI()
+    app.include_router(user_router)
+
+    @app.get("/threadpool/users/{user_id}")
+    async def get_user_threadpool(user_id: int, db: Session = Depends(get_db)):
+        user = await run_in_threadpool(user_helper.get_user, db=db, user_id=user_id)
+        if user is None:
+            raise HTTPException(status_code=404, detail="User not found")
+        return {"id": user.id, "username": user.username}
+
+    return app
+
+def seed_users(count: int) -> int:
+    """벤치마크용 사용자 생성 (이미 충분하면 건너뜀)"""
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        existing = db.query(User).count()
+        if existing < count:
+            db.add_all([
+                User(
+                    username=f"bench_user_{i}",
+                    email=f"bench_user_{i}@example.com",
+                    hashed_password="x",
+                    role=UserRole.senior,
+                )
+                for i in range(existing, count)
+            ])
+            db.commit()
+        return count
+    finally:
+        db.close()
+
+async def run_mode(client: httpx.AsyncClient, path: str, user_count: int, total: int, concurrency: int) -> dict:
+    latencies = []
+    counter = iter(range(total))
+
+    async def worker():
+        for i in counter:
+            start = time.perf_counter()
+            response = await client.get(path.format(user_id=i % user_count + 1))
+            latencies.append(time.perf_counter() - start)
+            if response.status_code != 200:
+                raise RuntimeError(f"{path}: 상태 코드 {response.status_code}")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": total / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="실행 중인 서버 주소 (미지정 시 프로세스 내 ASGI 앱 사용)")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    args = parser.parse_args()
+
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, limits=httpx.Limits(max_connections=args.concurrency))
+        modes = {"async": "/users/{user_id}"}
+    else:
+        seed_users(args.users)
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=build_app()), base_url="http://bench")
+        modes = {"threadpool": "/threadpool/users/{user_id}", "async": "/users/{user_id}"}
+
+    print(f"요청 {args.requests}건, 동시성 {args.concurrency}, 사용자 {args.users}명")
+    async with client:
+        for name, path in modes.items():
+            # 워밍업 후 측정
+            await run_mode(client, path, args.users, min(200, args.requests), min(20, args.concurrency))
+            result = await run_mode(client, path, args.users, args.requests, args.concurrency)
+            print(f"{name:>10}: {result['rps']:8.1f} req/s  p50 {result['p50_ms']:7.2f} ms  p99 {result['p99_ms']:7.2f} ms")
+    await async_engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
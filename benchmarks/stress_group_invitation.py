@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+그룹 초대코드 동시 수락 스트레스 테스트
+보호자 여러 명이 하나의 그룹 초대코드를 동시에 수락할 때의 소요 시간과 결과(연결 수, current_guardians)를 출력합니다.
+정원 준수 검증은 tests/test_group_invitation.py에서 합니다.
+
+사용 예:
+    python benchmarks/stress_group_invitation.py --guardians 200 --max-guardians 50
+    DATABASE_URL=postgresql://... python benchmarks/stress_group_invitation.py --concurrency 50
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{Path(__file__).parent / 'bench.db'}")
+
+from sqlalchemy import func, select
+
+from app.helper import invitation_helper
+from app.models.invitation import Invitation
+from app.models.user import FamilyRelationship, User, UserRole
+from app.utils.db import AsyncSessionLocal, Base, SessionLocal, async_engine, engine
+
+def seed(guardian_count: int) -> tuple:
+    """시니어 1명 + 보호자 guardian_count명 생성 후 (시니어 ID, 보호자 ID 목록) 반환"""
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        suffix = time.time_ns()
+        senior = User(username=f"stress_senior_{suffix}", email=f"stress_senior_{suffix}@example.com",
+                      hashed_password="x", role=UserRole.senior)
+        guardians = [
+            User(username=f"stress_guardian_{suffix}_{i}", email=f"stress_guardian_{suffix}_{i}@example.com",
+                 hashed_password="x", role=UserRole.guardian)
+            for i in range(guardian_count)
+        ]
+        db.add(senior)
+        db.add_all(guardians)
+        db.commit()
+        return senior.id, [guardian.id for guardian in guardians]
+    finally:
+        db.close()
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--guardians", type=int, default=100, help="동시에 수락하는 보호자 수")
+    parser.add_argument("--max-guardians", type=int, default=30, help="그룹 초대코드 정원")
+    parser.add_argument("--concurrency", type=int, default=20, help="동시 실행 수 (커넥션 풀 크기 이하 권장)")
+    args = parser.parse_args()
+
+    senior_id, guardian_ids = seed(args.guardians)
+    async with AsyncSessionLocal() as db:
+        invitation = await invitation_helper.create_group_invitation_code_async(
+            db, inviter_id=senior_id, max_guardians=args.max_guardians
+        )
+        code, invitation_id = invitation.code, invitation.id
+
+    results = {}
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def accept(guardian_id: int):
+        async with semaphore, AsyncSessionLocal() as db:
+            try:
+                await invitation_helper.accept_invitation_code_async(db, code, guardian_id)
+                outcome = "accepted"
+            except ValueError as e:
+                outcome = str(e)
+            results[outcome] = results.get(outcome, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(accept(guardian_id) for guardian_id in guardian_ids))
+    elapsed = time.perf_counter() - started
+
+    async with AsyncSessionLocal() as db:
+        current_guardians = (await db.execute(
+            select(Invitation.current_guardians).where(Invitation.id == invitation_id)
+        )).scalar()
+        relationships = (await db.execute(
+            select(func.count()).select_from(FamilyRelationship).where(FamilyRelationship.senior_id == senior_id)
+        )).scalar()
+    await async_engine.dispose()
+
+    expected = min(args.guardians, args.max_guardians)
+    print(f"보호자 {args.guardians}명 동시 수락, 정원 {args.max_guardians}, {elapsed:.2f}초")
+    print(f"결과: {results}")
+    print(f"current_guardians={current_guardians}, 가족 관계 {relationships}건 (기대값 {expected})")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+notification-service 서킷 브레이커 스트레스 테스트
+스텁 서버에 응답 지연/오류를 주입해 다음 단계를 재현하고, 각 단계의 호출 지연시간과 상태 전이 지표를 출력합니다.
+1. 정상: 회로 closed, 모든 호출 성공
+2. 지연 장애(타임아웃 초과) / 오류 장애(503): 연속 실패 후 open, 이후 호출은 타임아웃 없이 즉시 실패
+3. 복구: reset 시간이 지나면 half_open 시험 호출 성공 후 closed
+상태 전이 검증은 tests/test_notification_breaker.py에서 합니다.
+
+사용 예:
+    python benchmarks/stress_notification_breaker.py
+    python benchmarks/stub_notification_server.py --port 8002 &
+    python benchmarks/stress_notification_breaker.py --url http://localhost:8002
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{Path(__file__).parent / 'bench.db'}")
+
+import httpx
+
+from app.utils.circuit_breaker import CLOSED, OPEN, CircuitBreaker, CircuitOpenError
+from app.utils.notification_client import NotificationClient, _is_retryable
+from stub_notification_server import create_stub_app
+
+ENDPOINT = "/api/v1/notifications/invite"
+
+class TimeoutASGITransport(httpx.AsyncBaseTransport):
+    """ASGITransport는 타임아웃을 적용하지 않으므로 네트워크 전송처럼 읽기 타임아웃을 흉내 냄"""
+
+    def __init__(self, app, timeout: float):
+        self._transport = httpx.ASGITransport(app=app)
+        self._timeout = timeout
+
+    async def handle_async_request(self, request):
+        try:
+            return await asyncio.wait_for(self._transport.handle_async_request(request), self._timeout)
+        except asyncio.TimeoutError:
+            raise httpx.ReadTimeout("stub timeout", request=request)
+
+class Faults:
+    """스텁의 장애 주입 설정 변경 (같은 프로세스 또는 /faults API)"""
+
+    def __init__(self, stub, url: str):
+        self.stub = stub
+        self.url = url
+
+    async def set(self, **faults):
+        if self.stub is not None:
+            self.stub.state.faults.update(faults)
+        else:
+            async with httpx.AsyncClient(base_url=self.url) as admin:
+                (await admin.post("/faults", json=faults)).raise_for_status()
+
+async def run_calls(client: NotificationClient, count: int) -> dict:
+    outcomes = {"ok": 0, "failed": 0, "short_circuited": 0}
+    latencies = {key: [] for key in outcomes}
+    for i in range(count):
+        started = time.perf_counter()
+        try:
+            await client.post(ENDPOINT, {"inviter_id": 1, "invitation_code": f"CODE{i:04d}",
+                                         "notification_type": "family_invitation"})
+            outcome = "ok"
+        except CircuitOpenError:
+            outcome = "short_circuited"
+        except Exception:
+            outcome = "failed"
+        outcomes[outcome] += 1
+        latencies[outcome].append(time.perf_counter() - started)
+    return {
+        key: f"{outcomes[key]}건 (평균 {sum(values) / len(values) * 1e6:,.0f} µs)" if values else "0건"
+        for key, values in latencies.items()
+    }
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="단독 실행 중인 스텁 서버 주소 (미지정 시 같은 프로세스에서 실행)")
+    parser.add_argument("--calls", type=int, default=50, help="단계별 호출 수")
+    parser.add_argument("--timeout", type=float, default=0.5, help="알림 호출 타임아웃 (초)")
+    parser.add_argument("--failure-threshold", type=int, default=5)
+    parser.add_argument("--reset-seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    breaker = CircuitBreaker("notification-service", failure_threshold=args.failure_threshold,
+                             reset_timeout=args.reset_seconds, is_failure=_is_retryable)
+    client = NotificationClient(base_url=args.url or "http://stub", timeout=args.timeout,
+                                max_connections=20, retries=1, breaker=breaker)
+    stub = None
+    if args.url is None:
+        stub = create_stub_app()
+        client._client = httpx.AsyncClient(base_url="http://stub",
+                                           transport=TimeoutASGITransport(stub, args.timeout))
+    faults = Faults(stub, args.url)
+
+    phases = [
+        ("정상", {"latency": 0, "error_rate": 0}, CLOSED),
+        (f"지연 장애 ({args.timeout * 4}s)", {"latency": args.timeout * 4, "error_rate": 0}, OPEN),
+        ("복구", {"latency": 0, "error_rate": 0}, CLOSED),
+        ("오류 장애 (503)", {"latency": 0, "error_rate": 1.0}, OPEN),
+        ("복구", {"latency": 0, "error_rate": 0}, CLOSED),
+    ]
+    for name, fault, expected in phases:
+        await faults.set(**fault)
+        if expected == CLOSED and breaker.state != CLOSED:
+            # open -> half_open 전환 대기
+            await asyncio.sleep(args.reset_seconds)
+        started = time.perf_counter()
+        result = await run_calls(client, args.calls)
+        state = breaker.state
+        print(f"[{name}] {time.perf_counter() - started:.2f}s, 상태 {state} (기대값 {expected})")
+        for key, value in result.items():
+            print(f"    {key}: {value}")
+
+    print(f"지표: {breaker.stats()}")
+    await faults.set(latency=0, error_rate=0)
+    await client.aclose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+notification-service 스텁 서버
+user-service가 호출하는 알림 엔드포인트(단건/묶음)를 흉내 내고 받은 요청 수와 이벤트 수를 집계합니다.
+장애 상황 재현을 위해 응답 지연(latency)과 오류 응답(error_rate, 503)을 주입할 수 있고, 실행 중에도 /faults로 바꿀 수 있습니다.
+벤치마크에서는 같은 프로세스에서 ASGI 앱으로 사용하고, 단독 실행도 가능합니다.
+
+사용 예:
+    python benchmarks/stub_notification_server.py --port 8002 --reject-rate 0.1
+    python benchmarks/stub_notification_server.py --port 8002 --latency 12 --error-rate 0.5
+    curl -X POST localhost:8002/faults -H 'Content-Type: application/json' -d '{"latency": 0, "error_rate": 0}'
+    curl localhost:8002/stats
+"""
+
+import argparse
+import asyncio
+import random
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+def create_stub_app(reject_rate: float = 0.0, latency: float = 0.0, error_rate: float = 0.0) -> FastAPI:
+    """
+    reject_rate: 묶음 요청에서 이벤트별로 실패 응답을 돌려줄 확률 (이벤트별 확인 동작 확인용)
+    latency: 모든 알림 요청의 응답 지연 (초)
+    error_rate: 알림 요청 전체를 503으로 실패시킬 확률
+    """
+    app = FastAPI()
+    app.state.stats = {"requests": 0, "events": 0, "rejected": 0, "errors": 0}
+    app.state.events = []
+    app.state.faults = {"latency": latency, "error_rate": error_rate}
+
+    async def inject_faults():
+        """지연/오류 주입, 오류를 돌려줘야 하면 503 응답 반환"""
+        app.state.stats["requests"] += 1
+        if app.state.faults["latency"]:
+            await asyncio.sleep(app.state.faults["latency"])
+        if random.random() < app.state.faults["error_rate"]:
+            app.state.stats["errors"] += 1
+            return JSONResponse({"detail": "stub unavailable"}, status_code=503)
+        return None
+
+    @app.post("/api/v1/notifications/{kind}")
+    async def receive_one(kind: str, request: Request):
+        if (error := await inject_faults()) is not None:
+            return error
+        app.state.stats["events"] += 1
+        app.state.events.append((kind, await request.json()))
+        return {"success": True}
+
+    @app.post("/api/v1/notifications/{kind}/batch")
+    async def receive_batch(kind: str, request: Request):
+        if (error := await inject_faults()) is not None:
+            return error
+        results = []
+        for event in (await request.json())["events"]:
+            if random.random() < reject_rate:
+                app.state.stats["rejected"] += 1
+                results.append({"event_id": event["event_id"], "success": False, "error": "stub rejected"})
+                continue
+            app.state.stats["events"] += 1
+            app.state.events.append((kind, event))
+            results.append({"event_id": event["event_id"], "success": True})
+        return {"results": results}
+
+    @app.post("/faults")
+    async def set_faults(request: Request):
+        app.state.faults.update(await request.json())
+        return app.state.faults
+
+    @app.get("/stats")
+    async def stats():
+        return app.state.stats
+
+    return app
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8002)
+    parser.add_argument("--reject-rate", type=float, default=0.0)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+    uvicorn.run(create_stub_app(args.reject_rate, args.latency, args.error_rate), host="127.0.0.1", port=args.port)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+family_relationships 인덱스/유니크 제약조건 마이그레이션 스크립트
+1. 중복된 (senior_id, guardian_id) 관계를 정리합니다. (가장 먼저 생성된 행만 유지)
+2. (senior_id, guardian_id) 유니크 제약조건과 (guardian_id, senior_id) 인덱스를 추가합니다.
+3. 시니어/보호자 기준 조회 쿼리의 실행 계획(EXPLAIN)에서 인덱스 사용 여부를 확인합니다.
+"""
+
+import os
+import sys
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from sqlalchemy import text
+
+from app.helper import invitation_helper, user_helper
+from app.models.user import FamilyRelationship
+from app.utils.db import engine
+from app.utils.schema_migration import add_unique_constraint, autocommit_connection, create_index, explain, uses_index
+
+UNIQUE_NAME = "uq_family_relationships_senior_guardian"
+INDEX_NAME = "ix_family_relationships_guardian_senior"
+
+def migrate(conn) -> None:
+    print("\n1. 중복 가족 관계 정리 중...")
+    result = conn.execute(text("""
+        DELETE FROM family_relationships
+        WHERE id NOT IN (
+            SELECT MIN(id) FROM family_relationships GROUP BY senior_id, guardian_id
+        )
+    """))
+    print(f"✅ 중복 관계 {result.rowcount}건 삭제")
+
+    print("\n2. 유니크 제약조건/인덱스 추가 중...")
+    table = FamilyRelationship.__table__
+    add_unique_constraint(conn, next(c for c in table.constraints if c.name == UNIQUE_NAME))
+    print(f"✅ {UNIQUE_NAME}")
+    create_index(conn, next(i for i in table.indexes if i.name == INDEX_NAME))
+    print(f"✅ {INDEX_NAME}")
+
+def check_plans(conn) -> bool:
+    print("\n3. 실행 계획 확인:")
+    checks = [
+        ("시니어 기준 보호자 조회", user_helper._guardians_query(1), (UNIQUE_NAME,)),
+        ("보호자 기준 시니어 조회", user_helper._seniors_query(1), (INDEX_NAME,)),
+        ("가족 구성원 양방향 조회", invitation_helper._family_members_query(1), (UNIQUE_NAME, INDEX_NAME)),
+    ]
+    ok = True
+    for name, statement, index_names in checks:
+        plan = explain(conn, statement)
+        for index_name in index_names:
+            used = uses_index(plan, index_name)
+            ok = ok and used
+            print(f"{'✅' if used else '❌'} {name}: {index_name} {'사용' if used else '미사용'}")
+        for line in plan:
+            print(f"    {line}")
+    return ok
+
+if __name__ == "__main__":
+    print("🚀 family_relationships 인덱스 마이그레이션 시작")
+    print("=" * 50)
+
+    with autocommit_connection(engine) as conn:
+        migrate(conn)
+        success = check_plans(conn)
+
+    if success:
+        print("\n🎉 마이그레이션이 성공적으로 완료되었습니다!")
+    else:
+        print("\n❌ 일부 쿼리가 인덱스를 사용하지 않습니다. 실행 계획을 확인해주세요.")
+        sys.exit(1)
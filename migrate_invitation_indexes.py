@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+invitations 인덱스 마이그레이션 스크립트
+1. 초대코드 목록/만료 정리/기존 코드 만료 처리용 복합·부분 인덱스를 추가합니다.
+2. 각 쿼리의 실행 계획(EXPLAIN)에서 인덱스 사용 여부를 확인합니다.
+"""
+
+import os
+import sys
+from datetime import datetime
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from sqlalchemy import select
+
+from app.models.invitation import Invitation
+from app.utils.db import engine
+from app.utils.schema_migration import autocommit_connection, create_index, explain, uses_index
+
+INDEX_NAMES = (
+    "ix_invitations_inviter_created_at",
+    "ix_invitations_unused_expires_at",
+    "ix_invitations_inviter_unused_expires_at",
+)
+
+def migrate(conn) -> None:
+    print("\n1. 인덱스 추가 중...")
+    indexes = {index.name: index for index in Invitation.__table__.indexes}
+    for name in INDEX_NAMES:
+        create_index(conn, indexes[name])
+        print(f"✅ {name}")
+
+def check_plans(conn) -> bool:
+    print("\n2. 실행 계획 확인:")
+    now = datetime.utcnow()
+    checks = [
+        (
+            "초대코드 목록 (최신순)",
+            select(Invitation.id).where(Invitation.inviter_id == 1)
+            .order_by(Invitation.created_at.desc()).limit(100),
+            "ix_invitations_inviter_created_at"
+        ),
+        (
+            "만료 초대코드 정리",
+            select(Invitation.id).where(Invitation.expires_at < now, Invitation.is_used == False),
+            "ix_invitations_unused_expires_at"
+        ),
+        (
+            "기존 유효 초대코드 조회",
+            select(Invitation.id).where(
+                Invitation.inviter_id == 1, Invitation.is_used == False, Invitation.expires_at > now
+            ),
+            "ix_invitations_inviter_unused_expires_at"
+        ),
+    ]
+    ok = True
+    for name, statement, index_name in checks:
+        plan = explain(conn, statement)
+        used = uses_index(plan, index_name)
+        ok = ok and used
+        print(f"{'✅' if used else '❌'} {name}: {index_name} {'사용' if used else '미사용'}")
+        for line in plan:
+            print(f"    {line}")
+    return ok
+
+if __name__ == "__main__":
+    print("🚀 invitations 인덱스 마이그레이션 시작")
+    print("=" * 50)
+
+    with autocommit_connection(engine) as conn:
+        migrate(conn)
+        success = check_plans(conn)
+
+    if success:
+        print("\n🎉 마이그레이션이 성공적으로 완료되었습니다!")
+    else:
+        print("\n❌ 일부 쿼리가 인덱스를 사용하지 않습니다. 실행 계획을 확인해주세요.")
+        sys.exit(1)
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+refresh_tokens 마이그레이션 스크립트
+1. 폐기 사유(revoked_reason) 컬럼을 추가합니다. (로그아웃된 세션과 토큰 재사용 구분)
+"""
+
+import os
+import sys
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from app.models.refresh_token import RefreshToken
+from app.utils.db import engine
+from app.utils.schema_migration import add_column, autocommit_connection
+
+def migrate(conn) -> None:
+    print("\n1. 컬럼 추가 중...")
+    added = add_column(conn, RefreshToken.__table__.c.revoked_reason)
+    print(f"{'✅' if added else 'ℹ️'} revoked_reason {'추가' if added else '이미 존재'}")
+
+if __name__ == "__main__":
+    print("🚀 refresh_tokens 마이그레이션 시작")
+    print("=" * 50)
+
+    with autocommit_connection(engine) as conn:
+        migrate(conn)
+
+    print("\n🎉 마이그레이션이 성공적으로 완료되었습니다!")
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+users 인덱스 마이그레이션 스크립트
+1. 사용자 목록 키셋 페이지네이션용 (created_at, id) 인덱스를 추가합니다.
+2. 커서 다음 페이지 조회 쿼리의 실행 계획(EXPLAIN)에서 인덱스 사용 여부를 확인합니다.
+"""
+
+import os
+import sys
+from datetime import datetime
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from sqlalchemy import select
+
+from app.models.user import User
+from app.utils.db import engine
+from app.utils.pagination import encode_cursor, keyset_query
+from app.utils.schema_migration import autocommit_connection, create_index, explain, uses_index
+
+INDEX_NAME = "ix_users_created_at_id"
+
+def migrate(conn) -> None:
+    print("\n1. 인덱스 추가 중...")
+    create_index(conn, next(i for i in User.__table__.indexes if i.name == INDEX_NAME))
+    print(f"✅ {INDEX_NAME}")
+
+def check_plans(conn) -> bool:
+    print("\n2. 실행 계획 확인:")
+    statement = keyset_query(
+        select(User.id), User.created_at, User.id, 100, cursor=encode_cursor(datetime.utcnow(), 1)
+    )
+    plan = explain(conn, statement)
+    used = uses_index(plan, INDEX_NAME)
+    print(f"{'✅' if used else '❌'} 사용자 목록 다음 페이지: {INDEX_NAME} {'사용' if used else '미사용'}")
+    for line in plan:
+        print(f"    {line}")
+    return used
+
+if __name__ == "__main__":
+    print("🚀 users 인덱스 마이그레이션 시작")
+    print("=" * 50)
+
+    with autocommit_connection(engine) as conn:
+        migrate(conn)
+        success = check_plans(conn)
+
+    if success:
+        print("\n🎉 마이그레이션이 성공적으로 완료되었습니다!")
+    else:
+        print("\n❌ 쿼리가 인덱스를 사용하지 않습니다. 실행 계획을 확인해주세요.")
+        sys.exit(1)
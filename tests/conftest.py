@@ -0,0 +1,51 @@
+"""
+테스트 공용 설정
+app을 import하기 전에 임시 SQLite 데이터베이스를 DATABASE_URL로 지정하고,
+benchmarks/의 시드 함수와 스텁 서버를 그대로 사용하도록 경로를 추가합니다.
+
+실행:
+    python -m pytest
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+sys.path.append(str(project_root / "benchmarks"))
+
+os.environ["DATABASE_URL"] = f"sqlite:///{Path(tempfile.mkdtemp()) / 'test.db'}"
+
+from sqlalchemy import event
+
+from app.utils.db import Base, async_engine, engine
+from bench_common import StatementCounter
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    Base.metadata.create_all(bind=engine)
+    yield
+    engine.dispose()
+
+@pytest.fixture
+def run():
+    """코루틴을 새 이벤트 루프에서 실행 (aiosqlite 커넥션은 루프에 묶이므로 실행 후 풀 정리)"""
+    def _run(coro):
+        async def main():
+            try:
+                return await coro
+            finally:
+                await async_engine.dispose()
+        return asyncio.run(main())
+    return _run
+
+@pytest.fixture
+def statement_counter():
+    counter = StatementCounter(async_engine.sync_engine)
+    yield counter
+    event.remove(async_engine.sync_engine, "before_cursor_execute", counter._on_execute)
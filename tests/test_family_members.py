@@ -0,0 +1,20 @@
+"""가족 구성원 조회: 구성원 수와 관계없이 SQL 1회로 전체 구성원을 조회하는지 확인"""
+
+import pytest
+
+from app.utils.db import AsyncSessionLocal
+from bench_family_members import FAMILY_SIZES, LOOKUPS, seed_family
+
+@pytest.mark.parametrize("name", LOOKUPS)
+@pytest.mark.parametrize("size", FAMILY_SIZES)
+def test_family_lookup_is_single_statement(run, statement_counter, name, size):
+    user_id = seed_family(size)
+
+    async def lookup():
+        async with AsyncSessionLocal() as db:
+            statement_counter.count = 0
+            return await LOOKUPS[name](db, user_id)
+
+    rows = run(lookup())
+    assert len(rows) == size
+    assert statement_counter.count == 1
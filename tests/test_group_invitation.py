@@ -0,0 +1,50 @@
+"""그룹 초대코드 동시 수락: 정원(max_guardians)만큼만 연결되는지 확인"""
+
+import asyncio
+
+from sqlalchemy import func, select
+
+from app.helper import invitation_helper
+from app.models.invitation import Invitation
+from app.models.user import FamilyRelationship
+from app.utils.db import AsyncSessionLocal
+from stress_group_invitation import seed
+
+GUARDIANS = 40
+MAX_GUARDIANS = 15
+CONCURRENCY = 5
+
+async def accept_concurrently(senior_id: int, guardian_ids: list) -> dict:
+    async with AsyncSessionLocal() as db:
+        invitation = await invitation_helper.create_group_invitation_code_async(
+            db, inviter_id=senior_id, max_guardians=MAX_GUARDIANS
+        )
+        code, invitation_id = invitation.code, invitation.id
+
+    accepted = 0
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def accept(guardian_id: int):
+        nonlocal accepted
+        async with semaphore, AsyncSessionLocal() as db:
+            try:
+                await invitation_helper.accept_invitation_code_async(db, code, guardian_id)
+                accepted += 1
+            except ValueError:
+                pass
+
+    await asyncio.gather(*(accept(guardian_id) for guardian_id in guardian_ids))
+
+    async with AsyncSessionLocal() as db:
+        current_guardians = (await db.execute(
+            select(Invitation.current_guardians).where(Invitation.id == invitation_id)
+        )).scalar()
+        relationships = (await db.execute(
+            select(func.count()).select_from(FamilyRelationship).where(FamilyRelationship.senior_id == senior_id)
+        )).scalar()
+    return {"accepted": accepted, "current_guardians": current_guardians, "relationships": relationships}
+
+def test_concurrent_accepts_respect_capacity(run):
+    senior_id, guardian_ids = seed(GUARDIANS)
+    result = run(accept_concurrently(senior_id, guardian_ids))
+    assert result == {"accepted": MAX_GUARDIANS, "current_guardians": MAX_GUARDIANS, "relationships": MAX_GUARDIANS}
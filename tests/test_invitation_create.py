@@ -0,0 +1,40 @@
+"""초대코드 생성: 기존 코드 수와 관계없이 SQL 문 수가 일정하고 기존 코드가 모두 만료/비활성화되는지 확인"""
+
+import pytest
+from sqlalchemy import func, select
+
+from app.helper import invitation_helper, user_helper
+from app.models.invitation import Invitation
+from app.utils.db import AsyncSessionLocal
+from bench_invitation_create import seed_senior
+
+# 기존 코드 일괄 만료/비활성화 UPDATE, 초대코드 INSERT, 초대 알림 outbox INSERT, refresh SELECT
+EXPECTED_STATEMENTS = 4
+
+async def remaining_valid(db, senior_id: int, new_id: int, group: bool) -> int:
+    """새 코드를 제외하고 아직 유효 상태로 남은 기존 코드 수 (0이어야 함)"""
+    still_valid = Invitation.is_active == True if group else Invitation.is_used == False
+    return (await db.execute(
+        select(func.count()).select_from(Invitation).where(
+            Invitation.inviter_id == senior_id, Invitation.id != new_id, still_valid
+        )
+    )).scalar()
+
+@pytest.mark.parametrize("group", [False, True], ids=["single", "group"])
+@pytest.mark.parametrize("stale", [0, 10, 100])
+def test_create_retires_stale_codes_in_constant_statements(run, statement_counter, group, stale):
+    create = (invitation_helper.create_group_invitation_code_async if group
+              else invitation_helper.create_invitation_code_async)
+    senior_id = seed_senior(stale, group)
+
+    async def create_code():
+        async with AsyncSessionLocal() as db:
+            await user_helper.get_user_principal_async(db, senior_id)  # principal 캐시 워밍업
+            statement_counter.count = 0
+            invitation = await create(db, inviter_id=senior_id)
+            statements = statement_counter.count
+            return statements, await remaining_valid(db, senior_id, invitation.id, group)
+
+    statements, left = run(create_code())
+    assert statements == EXPECTED_STATEMENTS
+    assert left == 0
@@ -0,0 +1,60 @@
+"""알림 묶음 발송: 이벤트별 실패 후 재시도를 포함해 모든 알림이 정확히 한 번씩 전달되는지 확인"""
+
+import logging
+import random
+
+import httpx
+import pytest
+from sqlalchemy import func, select
+
+from app.helper import notification_helper
+from app.models.notification_outbox import NotificationOutbox
+from app.utils.db import AsyncSessionLocal
+from app.utils.notification_client import notification_client
+from bench_notification_batching import drain, enqueue
+from stub_notification_server import create_stub_app
+
+EVENTS = 200
+
+@pytest.fixture(autouse=True)
+def notification_config(monkeypatch):
+    """drain()이 바꾸는 묶음 설정을 테스트 후 복원, 재시도 경고 로그 생략"""
+    monkeypatch.setattr(notification_helper._config, "NOTIFICATION_BATCH_MAX_EVENTS",
+                        notification_helper._config.NOTIFICATION_BATCH_MAX_EVENTS)
+    monkeypatch.setattr(notification_helper._config, "NOTIFICATION_BATCH_WINDOW_SECONDS",
+                        notification_helper._config.NOTIFICATION_BATCH_WINDOW_SECONDS)
+    monkeypatch.setattr(logging.getLogger(notification_helper.__name__), "disabled", True)
+
+async def deliver(stub, max_events: int) -> int:
+    notification_client._client = httpx.AsyncClient(base_url="http://stub", transport=httpx.ASGITransport(app=stub))
+    try:
+        await enqueue(EVENTS)
+        await drain(max_events)
+    finally:
+        await notification_client.aclose()
+    async with AsyncSessionLocal() as db:
+        return (await db.execute(
+            select(func.count()).select_from(NotificationOutbox).where(NotificationOutbox.sent_at.is_(None))
+        )).scalar()
+
+@pytest.mark.parametrize("reject_rate", [0.0, 0.2])
+@pytest.mark.parametrize("max_events", [10, 50])
+def test_batched_delivery_is_exactly_once(run, max_events, reject_rate):
+    random.seed(max_events)
+    stub = create_stub_app(reject_rate)
+    unsent = run(deliver(stub, max_events))
+
+    delivered = [event["event_id"] for _, event in stub.state.events]
+    assert unsent == 0
+    assert len(delivered) == len(set(delivered)) == EVENTS
+    if reject_rate:
+        assert stub.state.stats["rejected"] > 0
+    else:
+        assert stub.state.stats["requests"] < EVENTS
+
+def test_single_delivery_sends_every_event(run):
+    stub = create_stub_app()
+    unsent = run(deliver(stub, 1))
+
+    assert unsent == 0
+    assert stub.state.stats["requests"] == stub.state.stats["events"] == EVENTS
@@ -0,0 +1,66 @@
+"""notification-service 서킷 브레이커: 장애 시 회로가 열려 즉시 실패하고, 복구 후 닫히는지 확인"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+from app.utils.notification_client import NotificationClient, _is_retryable
+from stress_notification_breaker import ENDPOINT, TimeoutASGITransport
+from stub_notification_server import create_stub_app
+
+FAILURE_THRESHOLD = 3
+RESET_SECONDS = 0.2
+TIMEOUT = 0.1
+PAYLOAD = {"inviter_id": 1, "invitation_code": "CODE0000", "notification_type": "family_invitation"}
+
+@pytest.fixture
+def stub():
+    return create_stub_app()
+
+@pytest.fixture
+def client(stub):
+    breaker = CircuitBreaker("notification-service", failure_threshold=FAILURE_THRESHOLD,
+                             reset_timeout=RESET_SECONDS, is_failure=_is_retryable)
+    client = NotificationClient(base_url="http://stub", timeout=TIMEOUT, max_connections=5, retries=1, breaker=breaker)
+    client._client = httpx.AsyncClient(base_url="http://stub", transport=TimeoutASGITransport(stub, TIMEOUT))
+    return client
+
+async def fail_until_open(client: NotificationClient):
+    for _ in range(FAILURE_THRESHOLD):
+        with pytest.raises(httpx.HTTPError):
+            await client.post(ENDPOINT, PAYLOAD)
+
+@pytest.mark.parametrize("fault", [{"error_rate": 1.0}, {"latency": TIMEOUT * 4}], ids=["error", "timeout"])
+def test_opens_after_consecutive_failures_and_short_circuits(run, stub, client, fault):
+    stub.state.faults.update(fault)
+
+    async def scenario():
+        try:
+            await fail_until_open(client)
+            assert client.breaker.state == OPEN
+            requests = stub.state.stats["requests"]
+            with pytest.raises(CircuitOpenError):
+                await client.post(ENDPOINT, PAYLOAD)
+            assert stub.state.stats["requests"] == requests
+        finally:
+            await client.aclose()
+
+    run(scenario())
+
+def test_closes_after_successful_half_open_call(run, stub, client):
+    stub.state.faults.update(error_rate=1.0)
+
+    async def scenario():
+        try:
+            await fail_until_open(client)
+            stub.state.faults.update(error_rate=0)
+            await asyncio.sleep(RESET_SECONDS)
+            assert client.breaker.state == HALF_OPEN
+            await client.post(ENDPOINT, PAYLOAD)
+            assert client.breaker.state == CLOSED
+        finally:
+            await client.aclose()
+
+    run(scenario())